@@ -408,15 +408,15 @@ async def enhance_image(request: EnhanceRequest):
                 raise HTTPException(status_code=404, detail="Image not found")
             
             # Load image in thread pool
-            async def load_existing_image():
+            def load_existing_image():
                 from PIL import Image
                 pil_image = Image.open(existing_path)
                 return np.array(pil_image).astype(np.float32) / 255.0
             
             import asyncio
             loop = asyncio.get_event_loop()
-            from services.async_image_processing import get_cpu_executor
-            image_array = await loop.run_in_executor(get_cpu_executor(), load_existing_image)
+            from services.async_image_processing import get_io_executor
+            image_array = await loop.run_in_executor(get_io_executor(), load_existing_image)
             
             # Create enhancement settings for async processing
             enhancement_settings = {
@@ -7,6 +7,7 @@ import tempfile
 import asyncio
 import functools
 import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -40,6 +41,10 @@ TILE_CACHE_DIR.mkdir(exist_ok=True)
 TILE_WIDTH = 256 * 2   # pixels
 TILE_HEIGHT = 256  * 2 # pixels (2:1 aspect ratio for full sky)
 MAX_ZOOM_LEVEL = 4  # From 0 (single tile) to 4 (16x16 grid)
+# Tiles are regenerated often, so favour encode speed over size
+PNG_COMPRESS_LEVEL = 1
+# Raw tile pixels are cached next to each PNG with this suffix
+TILE_ARRAY_SUFFIX = ".tile.npy"
 
 # Thread-local storage for starplot initialization
 _thread_local = threading.local()
@@ -47,6 +52,12 @@ _thread_local = threading.local()
 # Global lock for starplot database operations to prevent SQLite conflicts
 _starplot_lock = threading.Lock()
 
+# Recently used full sky images, least recently used first
+FULL_SKY_CACHE_SIZE = 2
+_full_sky_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+# Full sky images currently being loaded or rendered
+_full_sky_inflight: Dict[str, asyncio.Future] = {}
+
 
 class TileRequest(BaseModel):
     """Request model for sky tile generation."""
@@ -326,47 +337,200 @@ def _generate_full_sky_image_sync(z: int, projection: str, style: str, time: Opt
         raise
 
 
-def _extract_tile_from_image_sync(image_array: np.ndarray, x: int, y: int, z: int) -> bytes:
+def _extract_tile_array(image_array: np.ndarray, x: int, y: int, z: int) -> np.ndarray:
     """
-    Extract a tile from a high-resolution image (runs in worker thread).
+    Slice a tile out of a high-resolution full sky image.
     
     Args:
         image_array: Full sky image array
         x, y, z: Tile coordinates
         
     Returns:
-        PNG bytes for the tile
+        View of the tile region in ``image_array``
     """
-    import threading
-    logging.info(f"Extracting tile {x},{y} from full image in thread: {threading.current_thread().name}")
+    tiles_per_axis = 2 ** z
+    height, width = image_array.shape[:2]
     
-    try:
-        tiles_per_axis = 2 ** z
-        height, width = image_array.shape[:2]
-        
-        # Calculate tile boundaries
-        tile_width = width // tiles_per_axis
-        tile_height = height // tiles_per_axis
-        
-        # Extract tile region
-        start_x = x * tile_width
-        end_x = min(start_x + tile_width, width)
-        start_y = y * tile_height
-        end_y = min(start_y + tile_height, height)
-        
-        tile_array = image_array[start_y:end_y, start_x:end_x]
-        
-        # Convert to PNG bytes
-        pil_image = Image.fromarray(tile_array)
-        
-        import io
-        output_buffer = io.BytesIO()
-        pil_image.save(output_buffer, format='PNG')
-        return output_buffer.getvalue()
-        
-    except Exception as e:
-        logging.error(f"Failed to extract tile {x},{y}: {e}")
-        raise
+    # Calculate tile boundaries
+    tile_width = width // tiles_per_axis
+    tile_height = height // tiles_per_axis
+    
+    # Extract tile region
+    start_x = x * tile_width
+    end_x = min(start_x + tile_width, width)
+    start_y = y * tile_height
+    end_y = min(start_y + tile_height, height)
+    
+    return image_array[start_y:end_y, start_x:end_x]
+
+
+def get_tile_cache_path(x: int, y: int, z: int, projection: str, style: str,
+                        time: Optional[str] = None, latitude: float = 40.0,
+                        longitude: float = -74.0) -> Path:
+    """Get the cache file path for a tile."""
+    cache_key = generate_tile_cache_key(x, y, z, projection, style, time, latitude, longitude)
+    return TILE_CACHE_DIR / f"{cache_key}.png"
+
+
+def get_tile_array_path(cache_path: Path) -> Path:
+    """Get the path of the raw pixel array stored next to a cached tile PNG."""
+    return cache_path.with_suffix(TILE_ARRAY_SUFFIX)
+
+
+def _save_tile_sync(image_array: np.ndarray, cache_path: Path, keep_array: bool = False) -> Path:
+    """Encode a tile array as PNG and write it to the cache (runs in I/O thread)."""
+    if keep_array:
+        # Keep the raw pixels too so composites can be rebuilt without PNG decode
+        np.save(get_tile_array_path(cache_path), image_array)
+    tile_bytes = _array_to_png_bytes(image_array)
+    with open(cache_path, "wb") as f:
+        f.write(tile_bytes)
+    return cache_path
+
+
+async def render_sky_tile_async(x: int, y: int, z: int, projection: str = "mercator",
+                                style: str = "default", time: Optional[str] = None,
+                                latitude: float = 40.0, longitude: float = -74.0) -> np.ndarray:
+    """
+    Render the pixels of a sky tile on the CPU worker pool without encoding them.
+    
+    For zoom level 0: Generate individual tile
+    For zoom level >= 1: Generate full high-res image and extract tile
+    """
+    loop = asyncio.get_event_loop()
+    executor = get_cpu_executor()
+    
+    if z == 0:
+        # For zoom 0, generate single tile directly
+        logging.info(f"Generating individual tile {x},{y} at zoom {z}")
+        
+        # Generate bounds for this specific tile
+        bounds = tile_system.get_sky_bounds(x, y, z)
+        
+        # Run in thread pool
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(
+                _generate_individual_tile_sync,
+                bounds, projection, style, time, latitude, longitude, z
+            )
+        )
+    
+    # For zoom >= 1, generate full image and extract tile
+    logging.info(f"Generating full sky image for zoom {z}, then extracting tile {x},{y}")
+    
+    image_array = await _get_full_sky_image_async(z, projection, style, time, latitude, longitude)
+    
+    # Copy the tile into a plain in-memory array so the full image can be
+    # released; paging it in from the memory map stays off the event loop
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(np.array, _extract_tile_array(image_array, x, y, z))
+    )
+
+
+async def _load_or_generate_full_sky_image(full_image_cache_path: Path, z: int,
+                                           projection: str, style: str, time: Optional[str],
+                                           latitude: float, longitude: float) -> np.ndarray:
+    """
+    Load a full sky image from the disk cache, rendering and saving it if missing.
+    
+    The returned array is memory-mapped from the ``.npy`` file, so only the
+    regions that tiles are cut from get paged in and the kernel can drop
+    them again under memory pressure.
+    """
+    loop = asyncio.get_event_loop()
+    executor = get_cpu_executor()
+    
+    if full_image_cache_path.exists():
+        # Map cached full image
+        logging.info(f"Loading cached full sky image for zoom {z}")
+        return np.load(str(full_image_cache_path), mmap_mode='r')
+    
+    # Generate new full image
+    image_array = await loop.run_in_executor(
+        executor,
+        functools.partial(
+            _generate_full_sky_image_sync,
+            z, projection, style, time, latitude, longitude
+        )
+    )
+    
+    # Cache the full image for future tile extractions
+    await loop.run_in_executor(
+        executor,
+        functools.partial(np.save, str(full_image_cache_path), image_array)
+    )
+    logging.info(f"Cached full sky image for zoom {z}")
+    
+    # Hand back the file-backed copy so the rendered buffer can be freed
+    return np.load(str(full_image_cache_path), mmap_mode='r')
+
+
+async def _get_full_sky_image_async(z: int, projection: str, style: str, time: Optional[str],
+                                    latitude: float, longitude: float) -> np.ndarray:
+    """
+    Get the full sky image for a zoom level, keeping recent ones in memory.
+    
+    Concurrent requests for the same image share a single load/render
+    instead of each rendering the whole sky.
+    """
+    full_image_cache_key = f"fullsky_{z}_{projection}_{style}_{time}_{latitude}_{longitude}"
+    full_image_cache_key = hashlib.md5(full_image_cache_key.encode()).hexdigest()
+    
+    image_array = _full_sky_cache.get(full_image_cache_key)
+    if image_array is not None:
+        _full_sky_cache.move_to_end(full_image_cache_key)
+        return image_array
+    
+    task = _full_sky_inflight.get(full_image_cache_key)
+    if task is None:
+        full_image_cache_path = TILE_CACHE_DIR / f"{full_image_cache_key}.npy"
+        task = asyncio.ensure_future(_load_or_generate_full_sky_image(
+            full_image_cache_path, z, projection, style, time, latitude, longitude
+        ))
+        _full_sky_inflight[full_image_cache_key] = task
+        task.add_done_callback(lambda _: _full_sky_inflight.pop(full_image_cache_key, None))
+    
+    image_array = await asyncio.shield(task)
+    
+    _full_sky_cache[full_image_cache_key] = image_array
+    _full_sky_cache.move_to_end(full_image_cache_key)
+    while len(_full_sky_cache) > FULL_SKY_CACHE_SIZE:
+        _full_sky_cache.popitem(last=False)
+    return image_array
+
+
+async def warm_sky_tile_cache(z: int, projection: str = "mercator", style: str = "default",
+                              time: Optional[str] = None, latitude: float = 40.0,
+                              longitude: float = -74.0) -> None:
+    """
+    Prepare shared state for rendering tiles at a zoom level.
+    
+    Loads (or renders) the full sky image that all tiles at ``z`` are cut
+    from, so a batch of tile requests finds it ready instead of racing to
+    create it.
+    """
+    if not STARPLOT_AVAILABLE:
+        raise HTTPException(status_code=500, detail="Starplot not available")
+    
+    if z >= 1:
+        await _get_full_sky_image_async(z, projection, style, time, latitude, longitude)
+
+
+async def save_sky_tile_async(image_array: np.ndarray, cache_path: Path,
+                              keep_array: bool = False) -> Path:
+    """
+    Encode and write a rendered tile off the event loop.
+    
+    Runs on the default I/O thread pool rather than the CPU worker pool so
+    encoding one tile overlaps with rendering the next. With ``keep_array``
+    the raw pixels are also saved next to the PNG, for tools that read
+    tiles back (about ten times the PNG's size on disk).
+    """
+    await asyncio.to_thread(_save_tile_sync, image_array, cache_path, keep_array)
+    logging.info(f"Generated and cached sky tile: {cache_path}")
+    return cache_path
 
 
 async def generate_sky_tile_async(x: int, y: int, z: int, projection: str = "mercator",
@@ -381,85 +545,18 @@ async def generate_sky_tile_async(x: int, y: int, z: int, projection: str = "mer
     if not STARPLOT_AVAILABLE:
         raise HTTPException(status_code=500, detail="Starplot not available")
     
-    # Generate cache key and check if tile exists
-    cache_key = generate_tile_cache_key(x, y, z, projection, style, time, latitude, longitude)
-    cache_path = TILE_CACHE_DIR / f"{cache_key}.png"
+    # Check if tile exists in the cache
+    cache_path = get_tile_cache_path(x, y, z, projection, style, time, latitude, longitude)
     
     if cache_path.exists():
         logging.info(f"Returning cached tile: {cache_path}")
         return cache_path
     
-    loop = asyncio.get_event_loop()
-    executor = get_cpu_executor()
-    
     try:
-        if z == 0:
-            # For zoom 0, generate single tile directly
-            logging.info(f"Generating individual tile {x},{y} at zoom {z}")
-            
-            # Generate bounds for this specific tile
-            bounds = tile_system.get_sky_bounds(x, y, z)
-            
-            # Run in thread pool
-            image_array = await loop.run_in_executor(
-                executor,
-                functools.partial(
-                    _generate_individual_tile_sync,
-                    bounds, projection, style, time, latitude, longitude, z
-                )
-            )
-            
-            # Convert to PNG bytes
-            tile_bytes = await loop.run_in_executor(
-                executor,
-                functools.partial(_array_to_png_bytes, image_array)
-            )
-            
-        else:
-            # For zoom >= 1, generate full image and extract tile
-            logging.info(f"Generating full sky image for zoom {z}, then extracting tile {x},{y}")
-            
-            # Check if we have a cached full image for this zoom level
-            full_image_cache_key = f"fullsky_{z}_{projection}_{style}_{time}_{latitude}_{longitude}"
-            full_image_cache_key = hashlib.md5(full_image_cache_key.encode()).hexdigest()
-            full_image_cache_path = TILE_CACHE_DIR / f"{full_image_cache_key}.npy"
-            
-            if full_image_cache_path.exists():
-                # Load cached full image
-                logging.info(f"Loading cached full sky image for zoom {z}")
-                image_array = await loop.run_in_executor(
-                    executor,
-                    functools.partial(np.load, str(full_image_cache_path))
-                )
-            else:
-                # Generate new full image
-                image_array = await loop.run_in_executor(
-                    executor,
-                    functools.partial(
-                        _generate_full_sky_image_sync,
-                        z, projection, style, time, latitude, longitude
-                    )
-                )
-                
-                # Cache the full image for future tile extractions
-                await loop.run_in_executor(
-                    executor,
-                    functools.partial(np.save, str(full_image_cache_path), image_array)
-                )
-                logging.info(f"Cached full sky image for zoom {z}")
-            
-            # Extract the specific tile
-            tile_bytes = await loop.run_in_executor(
-                executor,
-                functools.partial(_extract_tile_from_image_sync, image_array, x, y, z)
-            )
-        
-        # Save tile to cache
-        with open(cache_path, "wb") as f:
-            f.write(tile_bytes)
-        
-        logging.info(f"Generated and cached sky tile: {cache_path}")
-        return cache_path
+        image_array = await render_sky_tile_async(
+            x, y, z, projection, style, time, latitude, longitude
+        )
+        return await save_sky_tile_async(image_array, cache_path)
         
     except Exception as e:
         logging.error(f"Failed to generate sky tile {x},{y},{z}: {e}")
@@ -595,7 +692,7 @@ def _array_to_png_bytes(image_array: np.ndarray) -> bytes:
     pil_image = Image.fromarray(image_array)
     import io
     output_buffer = io.BytesIO()
-    pil_image.save(output_buffer, format='PNG')
+    pil_image.save(output_buffer, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
     return output_buffer.getvalue()
 
 
@@ -686,8 +783,15 @@ async def clear_tile_cache():
         deleted_count = 0
         for tile_file in TILE_CACHE_DIR.glob("*.png"):
             tile_file.unlink()
+            get_tile_array_path(tile_file).unlink(missing_ok=True)
             deleted_count += 1
         
+        # Drop the full sky images tiles are cut from, so new tiles are
+        # rendered afresh instead of from a stale image
+        _full_sky_cache.clear()
+        for array_file in TILE_CACHE_DIR.glob("*.npy"):
+            array_file.unlink(missing_ok=True)
+        
         return {
             "success": True,
             "message": f"Cleared {deleted_count} cached tiles"
@@ -702,10 +806,12 @@ async def get_cache_stats():
     """Get statistics about the tile cache."""
     try:
         tile_files = list(TILE_CACHE_DIR.glob("*.png"))
-        total_size = sum(f.stat().st_size for f in tile_files)
+        array_files = list(TILE_CACHE_DIR.glob(f"*{TILE_ARRAY_SUFFIX}"))
+        total_size = sum(f.stat().st_size for f in tile_files + array_files)
         
         return {
             "cached_tiles": len(tile_files),
+            "cached_tile_arrays": len(array_files),
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2),
             "cache_directory": str(TILE_CACHE_DIR)
@@ -5,6 +5,7 @@ import json
 import logging as orig_logging
 import os
 import tempfile
+from contextlib import asynccontextmanager
 from typing import Optional, AsyncGenerator
 
 import click
@@ -362,50 +363,6 @@ class Telescope(BaseModel, arbitrary_types_allowed=True):
         # Create comprehensive enhancement processor
         self.enhancement_processor = ImageEnhancementProcessor()
 
-        async def startup():
-            """Connect to the Seestar on startup."""
-            try:
-                logging.info(f"Connecting to Seestar at {self.host}:{self.port}")
-
-                # Connect main client and imaging client in parallel
-                connection_tasks = [self.client.connect(), self.imaging.connect()]
-
-                results = await asyncio.gather(
-                    *connection_tasks, return_exceptions=True
-                )
-
-                # Check results
-                client_result, imaging_result = results
-
-                if isinstance(client_result, Exception):
-                    logging.error(
-                        f"Failed to connect main client to {self.host}:{self.port}: {client_result}"
-                    )
-                else:
-                    logging.info(
-                        f"Main client connected to Seestar at {self.host}:{self.port}"
-                    )
-
-                if isinstance(imaging_result, Exception):
-                    logging.error(
-                        f"Failed to connect imaging client to {self.host}:{self.imaging_port}: {imaging_result}"
-                    )
-                else:
-                    logging.info(
-                        f"Imaging client connected to Seestar at {self.host}:{self.imaging_port}"
-                    )
-
-                # If both succeeded, log overall success
-                if not isinstance(client_result, Exception) and not isinstance(
-                    imaging_result, Exception
-                ):
-                    logging.info(
-                        f"Successfully connected both clients to Seestar at {self.host}:{self.port}"
-                    )
-
-            except Exception as e:
-                logging.error(f"Failed to connect to Seestar: {e}")
-
         @router.get("/")
         async def root():
             """Root endpoint with basic info."""
@@ -1057,9 +1014,7 @@ class Telescope(BaseModel, arbitrary_types_allowed=True):
 
         self.router = router
 
-        # Don't auto-connect during API creation - let the controller handle connections
-        # asyncio.create_task(startup())
-
+        # Connections are handled by the controller's lifespan, not at API creation
         return router
 
     def initialize_clients(self):
@@ -1109,6 +1064,10 @@ class MockImagingClient:
         """Mock connect method."""
         self.is_connected = True
 
+    async def disconnect(self):
+        """Mock disconnect method."""
+        self.is_connected = False
+
     async def start_streaming(self):
         """Mock start streaming method."""
         self._is_streaming = True
@@ -1460,33 +1419,39 @@ class Controller:
 
                     websocket_manager = get_websocket_manager()
 
-                    for (
-                        telescope_data
-                    ) in telescopes:  # telescopes is already the parsed JSON list
-                        telescope_name = telescope_data.get("name")
-                        telescope_id = (
-                            telescope_data.get("serial_number") or telescope_name
-                        )
-
-                        # Create RemoteController object for WebSocket management
-                        remote_controller = RemoteController(
-                            host=host,
-                            port=port,
-                            telescope_id=telescope_id,
-                            controller_id=controller_key,
+                    # Create RemoteController objects for WebSocket management,
+                    # skipping telescopes the remote reports without any id
+                    remote_controllers = []
+                    for telescope_data in telescopes:
+                        telescope_id = telescope_data.get(
+                            "serial_number"
+                        ) or telescope_data.get("name")
+                        if not telescope_id:
+                            logging.warning(
+                                f"Skipping remote telescope without serial number or name on {host}:{port}"
+                            )
+                            continue
+                        remote_controllers.append(
+                            RemoteController(
+                                host=host,
+                                port=port,
+                                telescope_id=telescope_id,
+                                controller_id=controller_key,
+                            )
                         )
 
-                        # Register with WebSocket manager
-                        success = await websocket_manager.register_remote_controller(
-                            remote_controller
-                        )
+                    # Register with WebSocket manager, connecting concurrently
+                    results = await websocket_manager.register_remote_controllers(
+                        remote_controllers
+                    )
+                    for remote_controller, success in zip(remote_controllers, results):
                         if success:
                             logging.info(
-                                f"Registered remote controller WebSocket for telescope {telescope_id}"
+                                f"Registered remote controller WebSocket for telescope {remote_controller.telescope_id}"
                             )
                         else:
                             logging.warning(
-                                f"Failed to register remote controller WebSocket for telescope {telescope_id}"
+                                f"Failed to register remote controller WebSocket for telescope {remote_controller.telescope_id}"
                             )
 
                     # Persist to database if requested
@@ -1562,7 +1527,7 @@ class Controller:
         try:
             saved_controllers = await self.db.load_remote_controllers()
 
-            for controller_data in saved_controllers:
+            async def reconnect(controller_data):
                 host = controller_data["host"]
                 port = controller_data["port"]
                 name = controller_data.get("name")
@@ -1585,6 +1550,11 @@ class Controller:
                         f"Failed to reconnect to remote controller {host}:{port}"
                     )
 
+            # Reconnect to all saved controllers concurrently
+            await asyncio.gather(
+                *(reconnect(controller_data) for controller_data in saved_controllers)
+            )
+
         except Exception as e:
             logging.error(f"Failed to load saved remote controllers: {e}")
 
@@ -2227,6 +2197,69 @@ class Controller:
         except Exception as e:
             logging.error(f"Failed to add test telescope: {e}")
 
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI):
+        """Start background services on startup and release them on shutdown."""
+        # Start WebSocket manager first
+        from websocket_manager import get_websocket_manager
+
+        websocket_manager = get_websocket_manager()
+
+        await websocket_manager.start()
+        logging.info("WebSocket manager started")
+
+        # Start the image processing threads now rather than on the first request
+        from services.async_image_processing import warmup_image_executors
+
+        await asyncio.get_running_loop().run_in_executor(None, warmup_image_executors)
+
+        # Connect to all loaded telescopes once the loop is serving requests
+        connect_task = None
+        if self.telescopes:
+            click.secho(
+                f"Connecting to {len(self.telescopes)} telescopes after startup...",
+                fg="blue",
+            )
+            connect_task = asyncio.create_task(self.connect_all_telescopes())
+
+        try:
+            yield
+        finally:
+            if connect_task and not connect_task.done():
+                connect_task.cancel()
+                try:
+                    await connect_task
+                except asyncio.CancelledError:
+                    pass
+
+            # Disconnect all telescopes concurrently
+            disconnect_tasks = []
+            for telescope in self.telescopes.values():
+                for client in (telescope.client, telescope.imaging):
+                    if client and client.is_connected:
+                        disconnect_tasks.append(client.disconnect())
+            if disconnect_tasks:
+                await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+                logging.info("Disconnected all telescopes")
+
+            # Stop WebSocket manager
+            await websocket_manager.stop()
+            logging.info("WebSocket manager stopped")
+
+            from webrtc_router import cleanup_webrtc_service
+
+            await cleanup_webrtc_service()
+
+            # Shutdown image processing thread pool
+            from services.async_image_processing import shutdown_cpu_executor
+
+            shutdown_cpu_executor()
+            logging.info("Image processing thread pool shutdown")
+
+            from services.version_check import close_version_checker
+
+            await close_version_checker()
+
     async def runner(self):
         """Create and run the Uvicorn server."""
 
@@ -2316,51 +2349,6 @@ class Controller:
 
         self.app.include_router(catalog_router)
 
-        # Add startup handler to connect telescopes after server is ready
-        @self.app.on_event("startup")
-        async def startup_event():
-            # Start WebSocket manager first
-            from websocket_manager import get_websocket_manager
-
-            websocket_manager = get_websocket_manager()
-
-            await websocket_manager.start()
-            logging.info("WebSocket manager started")
-
-            # Connect to all loaded telescopes after server is fully started
-            if self.telescopes:
-
-                async def delayed_connect():
-                    await asyncio.sleep(2)  # Wait for server to be fully ready
-                    click.secho(
-                        f"Connecting to {len(self.telescopes)} telescopes after startup...",
-                        fg="blue",
-                    )
-                    await self.connect_all_telescopes()
-
-                asyncio.create_task(delayed_connect())
-
-        # Add shutdown handler for WebRTC cleanup
-        @self.app.on_event("shutdown")
-        async def shutdown_event():
-            # Stop WebSocket manager
-            from websocket_manager import get_websocket_manager
-
-            websocket_manager = get_websocket_manager()
-
-            await websocket_manager.stop()
-            logging.info("WebSocket manager stopped")
-
-            from webrtc_router import cleanup_webrtc_service
-
-            await cleanup_webrtc_service()
-
-            # Shutdown image processing thread pool
-            from services.async_image_processing import shutdown_cpu_executor
-
-            shutdown_cpu_executor()
-            logging.info("Image processing thread pool shutdown")
-
         # Add our own endpoints
         @self.app.get("/", response_class=HTMLResponse)
         async def root():
@@ -3466,8 +3454,12 @@ def server(server_port, seestar_host, seestar_port, remote_controller, no_discov
     if reload:
         click.echo("Auto-reload enabled - server will restart when code changes")
 
+    # The controller created below connects telescopes and tears down its
+    # services over the app's lifespan
     app = FastAPI(
-        title="Seestar API", description="API for controlling Seestar devices"
+        title="Seestar API",
+        description="API for controlling Seestar devices",
+        lifespan=lambda app: controller.lifespan(app),
     )
 
     # Add starmap endpoint to main API
@@ -3589,7 +3581,15 @@ def server(server_port, seestar_host, seestar_port, remote_controller, no_discov
         # Run the controller
         await controller.runner()
 
-    asyncio.run(run_server())
+    # uvloop.install() is deprecated; hand uvloop's loop to asyncio.run instead
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+
+    asyncio.run(run_server(), loop_factory=loop_factory)
 
     # router = create_telescope_api(seestar_host, seestar_port)
     # app.include_router(router)
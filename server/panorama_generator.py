@@ -86,31 +86,37 @@ class VideoPanoramaGenerator:
         logging.info(f"Extracted {len(frames)} frames from video")
         return frames
 
-    def detect_and_match_features(
-        self, img1: np.ndarray, img2: np.ndarray
-    ) -> Tuple[List[cv2.KeyPoint], List[cv2.KeyPoint], List[cv2.DMatch]]:
+    def detect_features(
+        self, img: np.ndarray
+    ) -> Tuple[List[cv2.KeyPoint], Optional[np.ndarray]]:
         """
-        Detect and match features between two images.
+        Detect keypoints and descriptors in a single image.
 
         Args:
-            img1: First image
-            img2: Second image
+            img: Input BGR image
 
         Returns:
-            Tuple of (keypoints1, keypoints2, good_matches)
+            Tuple of (keypoints, descriptors)
         """
-        # Convert to grayscale
-        gray1 = cv2.cvtColor(img1, cv2.COLOR_BGR2GRAY)
-        gray2 = cv2.cvtColor(img2, cv2.COLOR_BGR2GRAY)
+        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        return self.detector.detectAndCompute(gray, None)
 
-        # Detect keypoints and descriptors
-        kp1, des1 = self.detector.detectAndCompute(gray1, None)
-        kp2, des2 = self.detector.detectAndCompute(gray2, None)
+    def match_features(
+        self, des1: Optional[np.ndarray], des2: Optional[np.ndarray]
+    ) -> List[cv2.DMatch]:
+        """
+        Match precomputed descriptors between two images.
+
+        Args:
+            des1: Descriptors from first image
+            des2: Descriptors from second image
 
+        Returns:
+            List of good matches
+        """
         if des1 is None or des2 is None:
-            return [], [], []
+            return []
 
-        # Match features
         if self.feature_detector_type == "SIFT":
             matches = self.matcher.knnMatch(des1, des2, k=2)
             # Apply ratio test
@@ -128,7 +134,7 @@ class VideoPanoramaGenerator:
             num_good_matches = int(len(matches) * self.good_match_percent)
             good_matches = matches[:num_good_matches]
 
-        return kp1, kp2, good_matches
+        return good_matches
 
     def find_homography(
         self,
@@ -161,62 +167,97 @@ class VideoPanoramaGenerator:
 
         return homography
 
-    def warp_and_stitch(
-        self, img1: np.ndarray, img2: np.ndarray, homography: np.ndarray
-    ) -> np.ndarray:
+    def stitch_frames(self, frames: List[np.ndarray], label: str = "frame") -> np.ndarray:
         """
-        Warp and stitch two images using homography.
+        Stitch an ordered sequence of overlapping frames into a panorama.
+
+        Features are detected once per frame and each frame is matched against
+        the previously accepted frame, chaining homographies back to the
+        coordinate system of the first frame. The final canvas size is computed
+        from all transformed frame corners so the panorama is allocated once and
+        every frame is warped directly into it.
 
         Args:
-            img1: First image (base)
-            img2: Second image (to be warped)
-            homography: Homography matrix
+            frames: Ordered list of BGR frames
+            label: Name used for frames in log messages
 
         Returns:
-            Stitched panorama image
+            Panorama image as numpy array
         """
-        h1, w1 = img1.shape[:2]
-        h2, w2 = img2.shape[:2]
-
-        # Get corners of second image
-        corners2 = np.float32([[0, 0], [0, h2], [w2, h2], [w2, 0]]).reshape(-1, 1, 2)
-
-        # Transform corners using homography
-        transformed_corners = cv2.perspectiveTransform(corners2, homography)
-
-        # Find bounding box of stitched image
-        all_corners = np.concatenate(
-            [
-                np.float32([[0, 0], [0, h1], [w1, h1], [w1, 0]]).reshape(-1, 1, 2),
-                transformed_corners,
-            ],
-            axis=0,
-        )
+        features = [self.detect_features(frame) for frame in frames]
+
+        # First pass: homographies mapping each accepted frame into frame 0
+        # Each placement keeps its frame index for log messages
+        placements = [(0, frames[0], np.eye(3))]
+        prev_to_first = np.eye(3)
+        prev_kp, prev_des = features[0]
+
+        for i, frame in enumerate(frames[1:], 1):
+            logging.info(f"Processing {label} {i}/{len(frames) - 1}")
+
+            kp, des = features[i]
+            matches = self.match_features(des, prev_des)
+
+            if len(matches) < 10:
+                logging.warning(
+                    f"Not enough matches found for {label} {i}, skipping..."
+                )
+                continue
+
+            # Find homography from this frame into the previous one
+            homography = self.find_homography(kp, prev_kp, matches)
+
+            if homography is None:
+                logging.warning(
+                    f"Could not find homography for {label} {i}, skipping..."
+                )
+                continue
+
+            prev_to_first = prev_to_first @ homography
+            prev_kp, prev_des = kp, des
+            placements.append((i, frame, prev_to_first))
+
+        # Bounding box of all frames in first-frame coordinates
+        all_corners = []
+        for _, frame, to_first in placements:
+            h, w = frame.shape[:2]
+            corners = np.float32([[0, 0], [0, h], [w, h], [w, 0]]).reshape(-1, 1, 2)
+            all_corners.append(cv2.perspectiveTransform(corners, to_first))
+        all_corners = np.concatenate(all_corners, axis=0)
 
         [x_min, y_min] = np.int32(all_corners.min(axis=0).ravel() - 0.5)
         [x_max, y_max] = np.int32(all_corners.max(axis=0).ravel() + 0.5)
 
         # Translation matrix to shift the result
         translation = np.array([[1, 0, -x_min], [0, 1, -y_min], [0, 0, 1]])
+        size = (int(x_max - x_min), int(y_max - y_min))
 
-        # Warp second image
-        result_width = x_max - x_min
-        result_height = y_max - y_min
-        warped_img2 = cv2.warpPerspective(
-            img2, translation @ homography, (result_width, result_height)
-        )
-
-        # Create result image
-        result = np.zeros((result_height, result_width, 3), dtype=np.uint8)
-
-        # Place first image
-        result[-y_min : -y_min + h1, -x_min : -x_min + w1] = img1
-
-        # Blend with warped second image
-        mask = (warped_img2 > 0).any(axis=2)
-        result[mask] = warped_img2[mask]
+        # Second pass: warp each frame into a scratch region covering just its
+        # footprint, then copy its non-zero pixels over the canvas, so later
+        # frames win except where they are black
+        panorama = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+        for i, frame, to_first in placements:
+            try:
+                to_canvas = translation @ to_first
+                h, w = frame.shape[:2]
+                corners = np.float32([[0, 0], [0, h], [w, h], [w, 0]]).reshape(-1, 1, 2)
+                footprint = cv2.perspectiveTransform(corners, to_canvas).reshape(-1, 2)
+                x0, y0 = np.maximum(np.floor(footprint.min(axis=0)).astype(int), 0)
+                x1, y1 = np.minimum(np.ceil(footprint.max(axis=0)).astype(int) + 1, size)
+                if x0 >= x1 or y0 >= y1:
+                    continue
+
+                to_roi = np.array([[1, 0, -x0], [0, 1, -y0], [0, 0, 1]]) @ to_canvas
+                warped = cv2.warpPerspective(frame, to_roi, (int(x1 - x0), int(y1 - y0)))
+                roi = panorama[y0:y1, x0:x1]
+                mask = (warped > 0).any(axis=2)
+                roi[mask] = warped[mask]
+            except Exception as e:
+                logging.error(f"Error stitching {label} {i}: {e}")
+                continue
 
-        return result
+        logging.info(f"Stitched {len(placements)}/{len(frames)} {label}s")
+        return panorama
 
     def create_panorama(
         self,
@@ -243,34 +284,7 @@ class VideoPanoramaGenerator:
         if len(frames) < 2:
             raise ValueError("Need at least 2 frames to create panorama")
 
-        # Start with first frame
-        panorama = frames[0]
-
-        # Process each subsequent frame
-        for i, frame in enumerate(frames[1:], 1):
-            logging.info(f"Processing frame {i}/{len(frames) - 1}")
-
-            # Detect and match features
-            kp1, kp2, matches = self.detect_and_match_features(panorama, frame)
-
-            if len(matches) < 10:
-                logging.warning(f"Not enough matches found for frame {i}, skipping...")
-                continue
-
-            # Find homography
-            homography = self.find_homography(kp2, kp1, matches)  # Note: swapped order
-
-            if homography is None:
-                logging.warning(f"Could not find homography for frame {i}, skipping...")
-                continue
-
-            # Warp and stitch
-            try:
-                panorama = self.warp_and_stitch(panorama, frame, homography)
-                logging.info(f"Successfully stitched frame {i}")
-            except Exception as e:
-                logging.error(f"Error stitching frame {i}: {e}")
-                continue
+        panorama = self.stitch_frames(frames, "frame")
 
         # Save if output path provided
         if output_path:
@@ -309,34 +323,7 @@ class VideoPanoramaGenerator:
         if len(images) < 2:
             raise ValueError("Could not load enough valid images")
 
-        # Start with first image
-        panorama = images[0]
-
-        # Process each subsequent image
-        for i, image in enumerate(images[1:], 1):
-            logging.info(f"Processing image {i}/{len(images) - 1}")
-
-            # Detect and match features
-            kp1, kp2, matches = self.detect_and_match_features(panorama, image)
-
-            if len(matches) < 10:
-                logging.warning(f"Not enough matches found for image {i}, skipping...")
-                continue
-
-            # Find homography
-            homography = self.find_homography(kp2, kp1, matches)  # Note: swapped order
-
-            if homography is None:
-                logging.warning(f"Could not find homography for image {i}, skipping...")
-                continue
-
-            # Warp and stitch
-            try:
-                panorama = self.warp_and_stitch(panorama, image, homography)
-                logging.info(f"Successfully stitched image {i}")
-            except Exception as e:
-                logging.error(f"Error stitching image {i}: {e}")
-                continue
+        panorama = self.stitch_frames(images, "image")
 
         # Save if output path provided
         if output_path:
@@ -14,36 +14,211 @@ Example:
 
 import asyncio
 import argparse
+import hashlib
+import os
+import shutil
+import subprocess
+import struct
 import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Tuple
+from typing import Iterable, Iterator, List, NamedTuple, Tuple
 import numpy as np
 from PIL import Image
 
 # Import our sky map generation functions
-from api.routers.skymap import generate_sky_tile_async, TILE_CACHE_DIR, MAX_ZOOM_LEVEL
+from api.routers.skymap import (
+    generate_tile_cache_key,
+    get_tile_cache_path,
+    render_sky_tile_async,
+    save_sky_tile_async,
+    warm_sky_tile_cache,
+    TILE_CACHE_DIR,
+    MAX_ZOOM_LEVEL,
+    PNG_COMPRESS_LEVEL,
+    TILE_ARRAY_SUFFIX,
+)
 
+# oxipng optimization level used for composites
+OXIPNG_LEVEL = 4
+# File name prefix of composite images in the tile cache
+COMPOSITE_PREFIX = "sky_composite_"
+# Default number of tiles rendered at once, scaled to the host
+DEFAULT_CONCURRENCY = min(2 * (os.cpu_count() or 1), 32)
 
-def calculate_total_tiles(max_zoom: int) -> int:
-    """Calculate total number of tiles to generate across all zoom levels."""
+
+def calculate_total_tiles(max_zoom: int, min_zoom: int = 0) -> int:
+    """Calculate total number of tiles to generate from min_zoom up to max_zoom level."""
     total = 0
-    for z in range(max_zoom + 1):
+    for z in range(min_zoom, max_zoom + 1):
         tiles_per_axis = 2 ** z
         total += tiles_per_axis * tiles_per_axis
     return total
 
 
-def get_tile_coordinates(max_zoom: int) -> List[Tuple[int, int, int]]:
-    """Generate all tile coordinates (x, y, z) up to max_zoom level."""
-    coordinates = []
-    
-    for z in range(max_zoom + 1):
+class CacheStats(NamedTuple):
+    """File counts and total size of the tile cache directory."""
+    tiles: int
+    full_images: int
+    composites: int
+    total_bytes: int
+
+
+def scan_tile_cache() -> CacheStats:
+    """Count cached tiles, full sky images and composites in one directory pass."""
+    tiles = full_images = composites = total_bytes = 0
+    with os.scandir(TILE_CACHE_DIR) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            name = entry.name
+            if name.startswith(COMPOSITE_PREFIX) and name.endswith(".png"):
+                composites += 1
+            elif name.endswith(".png"):
+                tiles += 1
+            elif name.endswith(".npy") and not name.endswith(TILE_ARRAY_SUFFIX):
+                full_images += 1
+            total_bytes += entry.stat().st_size
+    return CacheStats(tiles, full_images, composites, total_bytes)
+
+
+def get_tile_coordinates(max_zoom: int, min_zoom: int = 0) -> Iterator[Tuple[int, int, int]]:
+    """Lazily yield all tile coordinates (x, y, z) from min_zoom up to max_zoom level."""
+    for z in range(min_zoom, max_zoom + 1):
         tiles_per_axis = 2 ** z
         for y in range(tiles_per_axis):
             for x in range(tiles_per_axis):
-                coordinates.append((x, y, z))
+                yield (x, y, z)
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """Serialize a PNG chunk with its length and CRC."""
+    crc = zlib.crc32(data, zlib.crc32(chunk_type))
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", crc)
+
+
+def write_png_rows(path: Path, width: int, height: int,
+                   strips: Iterable[np.ndarray], compress_level: int = 6) -> None:
+    """
+    Write an 8-bit RGB PNG from an iterable of horizontal strips.
     
-    return coordinates
+    Each strip is an ``(rows, width, 3)`` uint8 array and is compressed and
+    written as soon as it arrives, so the full image never has to be held
+    in memory. Rows use the PNG "Sub" filter, computed with NumPy.
+    
+    Args:
+        path: Output file path
+        width: Image width in pixels
+        height: Total image height in pixels; strips must add up to it
+        strips: Horizontal strips in top-to-bottom order
+        compress_level: zlib compression level (0-9)
+    """
+    compressor = zlib.compressobj(compress_level)
+    rows_written = 0
+    
+    with open(path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        # 8-bit truecolour, default compression/filter methods, no interlace
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        
+        for strip in strips:
+            rows, strip_width = strip.shape[:2]
+            if strip_width != width:
+                raise ValueError(f"Strip width {strip_width} does not match image width {width}")
+            
+            # Sub filter: each byte minus the same channel of the previous pixel
+            filtered = np.empty((rows, width * 3 + 1), dtype=np.uint8)
+            filtered[:, 0] = 1
+            pixels = filtered[:, 1:].reshape(rows, width, 3)
+            pixels[:, 0] = strip[:, 0]
+            np.subtract(strip[:, 1:], strip[:, :-1], out=pixels[:, 1:])
+            
+            data = compressor.compress(filtered.tobytes())
+            if data:
+                f.write(_png_chunk(b"IDAT", data))
+            rows_written += rows
+        
+        if rows_written != height:
+            raise ValueError(f"Wrote {rows_written} rows, expected {height}")
+        
+        f.write(_png_chunk(b"IDAT", compressor.flush()))
+        f.write(_png_chunk(b"IEND", b""))
+
+
+def optimize_png(path: Path) -> bool:
+    """
+    Losslessly recompress a PNG in place with oxipng, if it is installed.
+
+    Composites are written once and served many times, so they are saved
+    with fast zlib settings first and then handed to oxipng for the best
+    compression. oxipng runs filter trials and deflate on all cores; the
+    in-process ``pyoxipng`` binding is preferred over the CLI.
+
+    Returns:
+        True if the file was optimized
+    """
+    try:
+        import oxipng
+
+        oxipng.optimize(path, level=OXIPNG_LEVEL)
+        return True
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"   Warning: oxipng failed, keeping fast-compressed PNG: {e}")
+        return False
+
+    oxipng_bin = shutil.which("oxipng")
+    if not oxipng_bin:
+        return False
+
+    try:
+        subprocess.run(
+            [
+                oxipng_bin, "-o", str(OXIPNG_LEVEL), "--strip", "safe",
+                "--threads", str(os.cpu_count() or 1), "--quiet", str(path),
+            ],
+            check=True,
+        )
+        return True
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"   Warning: oxipng failed, keeping fast-compressed PNG: {e}")
+        return False
+
+
+def _decode_tile(tile_path: Path) -> np.ndarray | Exception:
+    """Load a tile into an RGB array, returning the error on failure."""
+    try:
+        if tile_path.name.endswith(TILE_ARRAY_SUFFIX):
+            # Raw pixels: memory-mapped, no decode
+            tile_array = np.load(tile_path, mmap_mode='r')
+            return tile_array[..., :3] if tile_array.ndim == 3 else np.dstack([tile_array] * 3)
+        
+        tile_image = Image.open(tile_path)
+        if tile_image.mode == 'RGBA':
+            # Dropping alpha is what convert('RGB') does; a view avoids the copy
+            return np.asarray(tile_image)[..., :3]
+        if tile_image.mode != 'RGB':
+            # Let decoders that support it produce RGB directly
+            tile_image.draft('RGB', tile_image.size)
+        if tile_image.mode != 'RGB':
+            tile_image = tile_image.convert('RGB')
+        return np.asarray(tile_image)
+    except Exception as e:
+        return e
+
+
+def _fit_tile(tile_array: np.ndarray, tile_height: int, tile_width: int) -> np.ndarray:
+    """Crop or black-pad a tile to exactly ``tile_height`` × ``tile_width``."""
+    if tile_array.shape[:2] == (tile_height, tile_width):
+        return tile_array
+    fitted = np.zeros((tile_height, tile_width, 3), dtype=np.uint8)
+    h = min(tile_array.shape[0], tile_height)
+    w = min(tile_array.shape[1], tile_width)
+    fitted[:h, :w] = tile_array[:h, :w]
+    return fitted
 
 
 def create_composite_sky_image(zoom_level: int, projection: str = "mercator", 
@@ -66,22 +241,30 @@ def create_composite_sky_image(zoom_level: int, projection: str = "mercator",
     
     tiles_per_axis = 2 ** zoom_level
     
+    # One directory scan instead of a stat() per tile; keep what identifies
+    # each file's contents for the change check below
+    with os.scandir(TILE_CACHE_DIR) as entries:
+        existing_files = {
+            entry.name: (entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in entries
+            if entry.name.endswith(".png") or entry.name.endswith(TILE_ARRAY_SUFFIX)
+        }
+    
+    # Tile file names in row-major order, computed once for both passes
+    tile_names = {
+        (x, y): f"{generate_tile_cache_key(x, y, zoom_level, projection, style, None, latitude, longitude)}.png"
+        for y in range(tiles_per_axis)
+        for x in range(tiles_per_axis)
+    }
+    
     # First, we need to determine the tile size by loading one tile
     sample_tile_path = None
     tile_width = tile_height = 512  # Default fallback
     
     # Find a sample tile to get dimensions
-    for y in range(tiles_per_axis):
-        for x in range(tiles_per_axis):
-            # Generate cache key to find the tile file
-            from api.routers.skymap import generate_tile_cache_key
-            cache_key = generate_tile_cache_key(x, y, zoom_level, projection, style, None, latitude, longitude)
-            tile_path = TILE_CACHE_DIR / f"{cache_key}.png"
-            
-            if tile_path.exists():
-                sample_tile_path = tile_path
-                break
-        if sample_tile_path:
+    for tile_name in tile_names.values():
+        if tile_name in existing_files:
+            sample_tile_path = TILE_CACHE_DIR / tile_name
             break
     
     if sample_tile_path:
@@ -97,46 +280,64 @@ def create_composite_sky_image(zoom_level: int, projection: str = "mercator",
     
     print(f"   Creating composite image: {composite_width}×{composite_height}")
     
-    # Create a new image with a black background
-    composite = Image.new('RGB', (composite_width, composite_height), color=(0, 0, 0))
-    
     tiles_found = 0
     tiles_missing = 0
     
-    # Place each tile in the composite
-    for y in range(tiles_per_axis):
-        for x in range(tiles_per_axis):
-            # Generate cache key to find the tile file
-            from api.routers.skymap import generate_tile_cache_key
-            cache_key = generate_tile_cache_key(x, y, zoom_level, projection, style, None, latitude, longitude)
-            tile_path = TILE_CACHE_DIR / f"{cache_key}.png"
-            
-            if tile_path.exists():
-                try:
-                    tile_image = Image.open(tile_path)
-                    # Convert to RGB if necessary
-                    if tile_image.mode != 'RGB':
-                        tile_image = tile_image.convert('RGB')
-                    
-                    # Calculate position in composite
-                    pos_x = x * tile_width
-                    pos_y = y * tile_height
-                    
-                    # Paste the tile into the composite
-                    composite.paste(tile_image, (pos_x, pos_y))
-                    tiles_found += 1
-                    
-                except Exception as e:
-                    print(f"   Warning: Failed to load tile {x},{y}: {e}")
-                    tiles_missing += 1
-            else:
-                tiles_missing += 1
+    # Collect the tiles that exist on disk, preferring raw arrays over PNGs
+    tile_paths = []
+    for (x, y), tile_name in tile_names.items():
+        array_name = tile_name.removesuffix(".png") + TILE_ARRAY_SUFFIX
+        if array_name in existing_files:
+            tile_paths.append((x, y, TILE_CACHE_DIR / array_name))
+        elif tile_name in existing_files:
+            tile_paths.append((x, y, TILE_CACHE_DIR / tile_name))
+        else:
+            tiles_missing += 1
     
     # Save the composite image
-    composite_filename = f"sky_composite_zoom{zoom_level}_{projection}_{style}_{latitude}N_{longitude}E.png"
+    composite_filename = f"{COMPOSITE_PREFIX}zoom{zoom_level}_{projection}_{style}_{latitude}N_{longitude}E.png"
     composite_path = TILE_CACHE_DIR / composite_filename
-    
-    composite.save(composite_path, 'PNG', optimize=True)
+    fingerprint_path = composite_path.with_suffix(".png.fp")
+    
+    # Skip the rebuild when none of the contributing tiles changed
+    fingerprint = hashlib.sha1("\n".join(
+        f"{x},{y}:{path.name}:{existing_files[path.name][0]}:{existing_files[path.name][1]}"
+        for x, y, path in tile_paths
+    ).encode()).hexdigest()
+    if (composite_path.exists() and fingerprint_path.exists()
+            and fingerprint_path.read_text() == fingerprint):
+        print(f"   ⏭️ Tiles unchanged, keeping existing composite: {composite_filename}")
+        return composite_path
+    
+    # Missing tiles stay as a shared black sentinel
+    blank_tile = np.zeros((tile_height, tile_width, 3), dtype=np.uint8)
+    
+    def tile_rows():
+        """Decode and yield one horizontal strip of tiles at a time."""
+        nonlocal tiles_found, tiles_missing
+        for y in range(tiles_per_axis):
+            row = [blank_tile] * tiles_per_axis
+            row_paths = [(x, path) for x, row_y, path in tile_paths if row_y == y]
+            # Decode tiles in parallel (zlib releases the GIL)
+            decoded = pool.map(_decode_tile, [path for _, path in row_paths])
+            for (x, _), tile_array in zip(row_paths, decoded):
+                if isinstance(tile_array, Exception):
+                    print(f"   Warning: Failed to load tile {x},{y}: {tile_array}")
+                    tiles_missing += 1
+                    continue
+                row[x] = _fit_tile(tile_array, tile_height, tile_width)
+                tiles_found += 1
+            yield np.concatenate(row, axis=1)
+    
+    # Only one strip of tiles is held in memory while the PNG is written
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        write_png_rows(
+            composite_path, composite_width, composite_height, tile_rows(),
+            compress_level=PNG_COMPRESS_LEVEL,
+        )
+    if optimize_png(composite_path):
+        print(f"   🗜️ Optimized composite with oxipng")
+    fingerprint_path.write_text(fingerprint)
     
     # Get file size
     file_size_mb = composite_path.stat().st_size / (1024 * 1024)
@@ -148,55 +349,205 @@ def create_composite_sky_image(zoom_level: int, projection: str = "mercator",
     return composite_path
 
 
-async def generate_tile_batch(coordinates: List[Tuple[int, int, int]], 
+@contextmanager
+def _progress(total: int):
+    """
+    Yield a callable that marks one tile as done.
+    
+    Uses a tqdm bar when tqdm is installed; otherwise prints a line at
+    every 10% of progress.
+    """
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        tqdm = None
+    
+    if tqdm is not None:
+        with tqdm(total=total, unit="tile") as bar:
+            yield lambda: bar.update(1)
+        return
+    
+    done = 0
+    step = max(total // 10, 1)
+    start = time.time()
+    
+    def advance():
+        nonlocal done
+        done += 1
+        if done % step == 0 or done == total:
+            print(f"   {done}/{total} tiles ({time.time() - start:.1f}s)")
+    
+    yield advance
+
+
+async def generate_tile_batch(coordinates: Iterable[Tuple[int, int, int]], 
                             projection: str, style: str, 
                             latitude: float, longitude: float,
-                            batch_size: int = 4) -> None:
-    """Generate tiles in batches to avoid overwhelming the system."""
+                            batch_size: int = DEFAULT_CONCURRENCY,
+                            total: int | None = None) -> None:
+    """
+    Generate tiles with at most ``batch_size`` renders in flight at once.
+    
+    A new tile starts as soon as any running render finishes, so one slow
+    tile no longer holds back the rest of its batch. PNG encoding and the
+    disk write happen after the render slot is released, so the next tile
+    renders while the previous one is written. A render only gives up its
+    slot once a write slot is free, so at most ``2 * batch_size`` rendered
+    tiles are held in memory at once. Coordinates are pulled from the iterable as
+    slots free up rather than all at once; ``total`` sizes the progress
+    report when ``coordinates`` has no length.
+    """
     
-    print(f"Processing {len(coordinates)} tiles in batches of {batch_size}")
+    render_slots = asyncio.Semaphore(batch_size)
+    encode_slots = asyncio.Semaphore(batch_size)
     
-    for i in range(0, len(coordinates), batch_size):
-        batch = coordinates[i:i + batch_size]
+    async def generate_tile(x: int, y: int, z: int) -> str | None:
+        """Generate one tile, returning an error message on failure."""
+        cache_path = get_tile_cache_path(x, y, z, projection, style, None, latitude, longitude)
+        if cache_path.exists():
+            return None
         
-        # Create tasks for this batch
-        tasks = []
-        for x, y, z in batch:
-            task = generate_sky_tile_async(
-                x=x, y=y, z=z,
-                projection=projection,
-                style=style,
-                time=None,  # Use current time
-                latitude=latitude,
-                longitude=longitude
-            )
-            tasks.append((task, x, y, z))
+        try:
+            async with render_slots:
+                tile_array = await render_sky_tile_async(
+                    x=x, y=y, z=z,
+                    projection=projection,
+                    style=style,
+                    time=None,  # Use current time
+                    latitude=latitude,
+                    longitude=longitude
+                )
+                # Hand the tile over to a write slot before rendering the next
+                await encode_slots.acquire()
+            try:
+                await save_sky_tile_async(tile_array, cache_path, keep_array=True)
+            finally:
+                encode_slots.release()
+        except Exception as e:
+            return f"{x},{y},{z}: {e}"
+        return None
+    
+    if total is None:
+        total = len(coordinates)
+    print(f"Processing {total} tiles with concurrency {batch_size}")
+    
+    # Keep enough tasks queued to fill every render and write slot, topping
+    # up from the iterator as they finish
+    max_pending = 2 * batch_size
+    coordinates = iter(coordinates)
+    pending = set()
+    failures = []
+    with _progress(total) as advance:
+        while True:
+            for x, y, z in coordinates:
+                pending.add(asyncio.ensure_future(generate_tile(x, y, z)))
+                if len(pending) >= max_pending:
+                    break
+            if not pending:
+                break
+            
+            # Report progress per completion without a stdout write for every tile
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                error = task.result()
+                if error:
+                    failures.append(error)
+                advance()
+    
+    for error in failures:
+        print(f"❌ Failed tile {error}")
+
+
+def _downsample_children(child_paths: List[Path | None]) -> np.ndarray:
+    """
+    Build a parent tile from its four children (runs in worker thread).
+    
+    Args:
+        child_paths: Top-left, top-right, bottom-left, bottom-right child tiles;
+            ``None`` or unreadable children are treated as black
         
-        # Execute batch concurrently
-        print(f"Generating batch {i//batch_size + 1}/{(len(coordinates) + batch_size - 1)//batch_size}: ", end="")
+    Returns:
+        Parent tile pixels, box-filtered down to the size of the first
+        readable child
         
-        batch_start = time.time()
+    Raises:
+        ValueError: If none of the children can be read
+    """
+    decoded = [_decode_tile(path) if path else None for path in child_paths]
+    sample = next(
+        (tile for tile in decoded if tile is not None and not isinstance(tile, Exception)),
+        None
+    )
+    if sample is None:
+        errors = [str(tile) for tile in decoded if isinstance(tile, Exception)]
+        raise ValueError("; ".join(errors) or "no readable child tiles")
+    tile_height, tile_width = sample.shape[:2]
+    
+    children = []
+    for tile_array in decoded:
+        if tile_array is None or isinstance(tile_array, Exception):
+            tile_array = np.zeros((tile_height, tile_width, 3), dtype=np.uint8)
+        children.append(_fit_tile(tile_array, tile_height, tile_width))
+    
+    block = np.concatenate([
+        np.concatenate(children[:2], axis=1),
+        np.concatenate(children[2:], axis=1),
+    ], axis=0)
+    parent = Image.fromarray(block).resize((tile_width, tile_height), Image.Resampling.BOX)
+    return np.asarray(parent)
+
+
+def _find_tile_file(x: int, y: int, z: int, projection: str, style: str,
+                    latitude: float, longitude: float) -> Path | None:
+    """Return the cached raw array or PNG for a tile, if either exists."""
+    cache_path = get_tile_cache_path(x, y, z, projection, style, None, latitude, longitude)
+    array_path = cache_path.with_suffix(TILE_ARRAY_SUFFIX)
+    if array_path.exists():
+        return array_path
+    if cache_path.exists():
+        return cache_path
+    return None
+
+
+async def derive_lower_zoom_tiles(max_zoom: int, projection: str, style: str,
+                                  latitude: float, longitude: float) -> None:
+    """
+    Fill zoom levels below ``max_zoom`` by 2×2 box-downsampling the level above.
+    
+    This avoids rendering the sky again for every coarser level. Note that
+    rendered tiles at lower zooms normally show fewer stars and labels;
+    derived tiles keep the detail of ``max_zoom``.
+    """
+    for z in range(max_zoom - 1, -1, -1):
+        tiles_per_axis = 2 ** z
+        print(f"🔽 Deriving zoom {z} from zoom {z + 1}")
         
-        try:
-            # Run all tasks in the batch
-            results = await asyncio.gather(*[task for task, x, y, z in tasks], return_exceptions=True)
+        async def derive_tile(x: int, y: int) -> None:
+            cache_path = get_tile_cache_path(x, y, z, projection, style, None, latitude, longitude)
+            if cache_path.exists():
+                return
             
-            # Check results and report
-            for (_, x, y, z), result in zip(tasks, results):
-                if isinstance(result, Exception):
-                    print(f"❌ Failed tile {x},{y},{z}: {result}")
-                else:
-                    print(f"✅ {x},{y},{z} ", end="")
+            child_paths = [
+                _find_tile_file(2 * x + dx, 2 * y + dy, z + 1, projection, style, latitude, longitude)
+                for dy in (0, 1)
+                for dx in (0, 1)
+            ]
+            if not any(child_paths):
+                print(f"❌ No child tiles for {x},{y},{z}")
+                return
             
-        except Exception as e:
-            print(f"❌ Batch failed: {e}")
-        
-        batch_time = time.time() - batch_start
-        print(f"(batch took {batch_time:.1f}s)")
+            try:
+                tile_array = await asyncio.to_thread(_downsample_children, child_paths)
+            except ValueError as e:
+                print(f"❌ Failed tile {x},{y},{z}: {e}")
+                return
+            await save_sky_tile_async(tile_array, cache_path, keep_array=True)
         
-        # Small delay between batches to prevent overwhelming the system
-        if i + batch_size < len(coordinates):
-            await asyncio.sleep(0.5)
+        await asyncio.gather(*(
+            derive_tile(x, y)
+            for y in range(tiles_per_axis)
+            for x in range(tiles_per_axis)
+        ))
 
 
 async def pregenerate_tiles(max_zoom: int = 2, 
@@ -204,8 +555,9 @@ async def pregenerate_tiles(max_zoom: int = 2,
                           style: str = "default",
                           latitude: float = 40.0,
                           longitude: float = -74.0,
-                          batch_size: int = 4,
-                          create_composites: bool = True) -> None:
+                          batch_size: int = DEFAULT_CONCURRENCY,
+                          create_composites: bool = True,
+                          derive_lower_zooms: bool = False) -> None:
     """
     Pre-generate all sky map tiles up to the specified zoom level.
     
@@ -216,6 +568,9 @@ async def pregenerate_tiles(max_zoom: int = 2,
         latitude: Observer latitude
         longitude: Observer longitude
         batch_size: Number of tiles to generate concurrently
+        create_composites: Whether to build composite images afterwards
+        derive_lower_zooms: Only render ``max_zoom`` and build coarser levels
+            by downsampling it
     """
     
     print("🌟 Sky Map Tile Pre-generation Script")
@@ -228,7 +583,8 @@ async def pregenerate_tiles(max_zoom: int = 2,
     
     # Calculate scope
     total_tiles = calculate_total_tiles(max_zoom)
-    coordinates = get_tile_coordinates(max_zoom)
+    # Levels rendered through starplot; coarser ones may be derived instead
+    first_rendered_zoom = max_zoom if derive_lower_zooms else 0
     
     print(f"📊 Generation Parameters:")
     print(f"   Max zoom level: {max_zoom}")
@@ -236,7 +592,9 @@ async def pregenerate_tiles(max_zoom: int = 2,
     print(f"   Style: {style}")
     print(f"   Observer: {latitude}°N, {longitude}°E")
     print(f"   Total tiles: {total_tiles}")
-    print(f"   Batch size: {batch_size}")
+    print(f"   Concurrency: {batch_size}")
+    if derive_lower_zooms:
+        print(f"   Lower zooms: downsampled from zoom {max_zoom}")
     print(f"   Cache directory: {TILE_CACHE_DIR}")
     print()
     
@@ -254,12 +612,11 @@ async def pregenerate_tiles(max_zoom: int = 2,
     TILE_CACHE_DIR.mkdir(exist_ok=True)
     
     # Check existing cache
-    existing_tiles = list(TILE_CACHE_DIR.glob("*.png"))
-    existing_full_images = list(TILE_CACHE_DIR.glob("*.npy"))
+    existing = scan_tile_cache()
     
     print(f"💾 Cache Status:")
-    print(f"   Existing tiles: {len(existing_tiles)}")
-    print(f"   Existing full images: {len(existing_full_images)}")
+    print(f"   Existing tiles: {existing.tiles}")
+    print(f"   Existing full images: {existing.full_images}")
     print()
     
     # Confirm before starting
@@ -269,15 +626,23 @@ async def pregenerate_tiles(max_zoom: int = 2,
     start_time = time.time()
     
     try:
+        # Load or render each level's full sky image once, before any tile needs it
+        for z in range(first_rendered_zoom, max_zoom + 1):
+            await warm_sky_tile_cache(z, projection, style, None, latitude, longitude)
+        
         await generate_tile_batch(
-            coordinates=coordinates,
+            coordinates=get_tile_coordinates(max_zoom, min_zoom=first_rendered_zoom),
             projection=projection,
             style=style,
             latitude=latitude,
             longitude=longitude,
-            batch_size=batch_size
+            batch_size=batch_size,
+            total=calculate_total_tiles(max_zoom, min_zoom=first_rendered_zoom)
         )
         
+        if derive_lower_zooms:
+            await derive_lower_zoom_tiles(max_zoom, projection, style, latitude, longitude)
+        
         end_time = time.time()
         total_time = end_time - start_time
         
@@ -288,41 +653,38 @@ async def pregenerate_tiles(max_zoom: int = 2,
         print(f"⚡ Average: {total_time/total_tiles:.2f} seconds per tile")
         
         # Check final cache status
-        final_tiles = list(TILE_CACHE_DIR.glob("*.png"))
-        final_full_images = list(TILE_CACHE_DIR.glob("*.npy"))
+        final = scan_tile_cache()
         
         print(f"💾 Final Cache Status:")
-        print(f"   Total tiles: {len(final_tiles)}")
-        print(f"   Total full images: {len(final_full_images)}")
+        print(f"   Total tiles: {final.tiles}")
+        print(f"   Total full images: {final.full_images}")
         
         # Create composite images for each zoom level
-        composite_paths = []
         if create_composites:
             print(f"\n🖼️ Creating composite sky images...")
             
             for z in range(max_zoom + 1):
                 try:
-                    composite_path = create_composite_sky_image(
+                    create_composite_sky_image(
                         zoom_level=z,
                         projection=projection,
                         style=style,
                         latitude=latitude,
                         longitude=longitude
                     )
-                    composite_paths.append(composite_path)
                 except Exception as e:
                     print(f"   ❌ Failed to create composite for zoom {z}: {e}")
         else:
             print(f"\n⏭️ Skipping composite image creation")
         
         # Calculate final cache size including composites
-        all_files = final_tiles + final_full_images + composite_paths
-        total_size_mb = sum(f.stat().st_size for f in all_files if f.exists()) / (1024*1024)
+        final = scan_tile_cache()
+        total_size_mb = final.total_bytes / (1024*1024)
         
         print(f"\n📊 Complete Cache Summary:")
-        print(f"   Individual tiles: {len(final_tiles)}")
-        print(f"   Full sky images: {len(final_full_images)}")
-        print(f"   Composite images: {len(composite_paths)}")
+        print(f"   Individual tiles: {final.tiles}")
+        print(f"   Full sky images: {final.full_images}")
+        print(f"   Composite images: {final.composites}")
         print(f"   Total cache size: {total_size_mb:.1f} MB")
         print()
         print(f"🌟 Sky map tiles and composite images are now cached and ready for fast loading!")
@@ -389,10 +751,19 @@ Examples:
     )
     
     parser.add_argument(
-        "--batch-size", 
+        "--concurrency", "--batch-size",
+        dest="batch_size",
+        metavar="N",
         type=int, 
-        default=4,
-        help="Number of tiles to generate concurrently (default: 4)"
+        default=DEFAULT_CONCURRENCY,
+        help=f"Number of tiles to generate concurrently (default: {DEFAULT_CONCURRENCY}, "
+             "twice the CPU count capped at 32)"
+    )
+    
+    parser.add_argument(
+        "--derive-lower-zooms",
+        action="store_true",
+        help="Only render the max zoom level and build coarser levels by downsampling it"
     )
     
     parser.add_argument(
@@ -426,7 +797,8 @@ Examples:
         latitude=args.latitude,
         longitude=args.longitude,
         batch_size=args.batch_size,
-        create_composites=not args.no_composite
+        create_composites=not args.no_composite,
+        derive_lower_zooms=args.derive_lower_zooms
     ))
 
 
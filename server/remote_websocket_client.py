@@ -6,17 +6,68 @@ allowing the server to proxy WebSocket communications transparently.
 """
 
 import asyncio
+import itertools
 import json
 import logging
+import socket
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, Any, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, List, Tuple
 
 import websockets
+from websockets.asyncio.client import ClientConnection
 from websockets.exceptions import ConnectionClosed, InvalidURI
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+from websockets.protocol import State
+
+from websocket_protocol import (
+    MSGPACK_SUBPROTOCOL,
+    msgpack,
+    pack_message,
+    unpack_message,
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on responses awaited at once; the oldest waiter is failed beyond it
+MAX_PENDING_MESSAGES = 4096
+
+# Upper bound on WebSocket opening or closing handshakes a manager runs at once
+MAX_CONCURRENT_HANDSHAKES = 32
+
+# Most queued outbound messages coalesced into a single batch frame
+MAX_BATCH_MESSAGES = 64
+
+# Largest inbound frame accepted, and how many frames websockets buffers before
+# it stops reading from the socket
+MAX_FRAME_SIZE = 2**20
+MAX_QUEUED_FRAMES = 16
+
+# Messages awaiting the message handler; the oldest is dropped beyond it
+MAX_INBOUND_MESSAGES = 256
+
+# Consecutive controller heartbeats that may go missing before the link is
+# considered dead, so a single late heartbeat does not force a reconnect
+MAX_MISSED_HEARTBEATS = 2
+
+try:
+    import orjson
+
+    def _dumps(message: Dict[str, Any]) -> str:
+        # Remote controllers read text frames, so keep the payload a str
+        return orjson.dumps(message).decode()
+
+    _loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 
 class RemoteConnectionState(Enum):
     """Connection states for remote WebSocket client."""
@@ -28,7 +79,7 @@ class RemoteConnectionState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RemoteController:
     """Remote controller configuration."""
 
@@ -41,6 +92,12 @@ class RemoteController:
     heartbeat_interval: float = 30.0
     health_check_interval: float = 60.0  # Check connection health every 60 seconds
     message_timeout: float = 120.0  # Force reconnect if no messages for 2 minutes
+    standby_connections: int = 1  # Warm connections kept ready for fast reconnects
+
+    def __post_init__(self):
+        # Interned ids make the manager's telescope lookups identity comparisons
+        if isinstance(self.telescope_id, str):
+            object.__setattr__(self, "telescope_id", sys.intern(self.telescope_id))
 
 
 class RemoteWebSocketClient:
@@ -58,26 +115,59 @@ class RemoteWebSocketClient:
         self,
         controller: RemoteController,
         message_handler: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        address_cache: Optional[Dict[Tuple[str, int], str]] = None,
     ):
         self.controller = controller
         self.message_handler = message_handler
 
-        # Connection state
+        # Resolved addresses, shared with other clients of the same manager
+        self._address_cache = address_cache if address_cache is not None else {}
+
+        # Connection state; assigning it also refreshes _is_connected
+        self._is_connected = False
         self.connection_state = RemoteConnectionState.DISCONNECTED
-        self.websocket: Optional[websockets.WebSocketServerProtocol] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Cleared while a connection attempt is in flight
+        self._connect_event = asyncio.Event()
+        self._connect_event.set()
+        self.websocket: Optional[ClientConnection] = None
+        # Set when the controller accepted the MessagePack subprotocol
+        self._use_msgpack = False
+        # Set when the controller's heartbeats advertise batch frame support
+        self._peer_batches = False
+
+        # Outbound queue drained by the writer task
+        self._outbox: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+
+        # Inbound queue drained into message_handler by the dispatcher task;
+        # it outlives reconnects so messages already received are delivered
+        self._inbox: Optional[asyncio.Queue] = None
+        self._dispatch_task: Optional[asyncio.Task] = None
+        self.dropped_messages = 0
+
+        # Inbound listener and any in-flight disconnection handling
+        self._listener_task: Optional[asyncio.Task] = None
+        self._disconnect_task: Optional[asyncio.Task] = None
+        self._handling_disconnect = False
 
         # Reconnection logic
         self.reconnect_attempts = 0
         self.reconnect_task: Optional[asyncio.Task] = None
 
+        # Warm standby connections, each drained by its own holder task
+        self._standby: Dict[Any, asyncio.Task] = {}
+        self._standby_fill_task: Optional[asyncio.Task] = None
+
         # Health monitoring
         self.last_heartbeat = 0
         self.last_message_time = 0
-        self.heartbeat_task: Optional[asyncio.Task] = None
-        self.health_check_task: Optional[asyncio.Task] = None
+        self._check_handle: Optional[asyncio.TimerHandle] = None
+        self._heartbeat_handle: Optional[asyncio.TimerHandle] = None
 
         # Message handling
-        self.pending_messages: Dict[str, asyncio.Future] = {}
+        self.pending_messages: OrderedDict[str, asyncio.Future] = OrderedDict()
+        self._next_id = itertools.count(1).__next__
 
         # Subscription tracking for restoration after reconnect
         self.active_subscriptions: Dict[str, list] = {}
@@ -86,23 +176,23 @@ class RemoteWebSocketClient:
             f"Initialized remote WebSocket client for {controller.host}:{controller.port}"
         )
 
+    @property
+    def connection_state(self) -> RemoteConnectionState:
+        """Current connection state."""
+        return self._connection_state
+
+    @connection_state.setter
+    def connection_state(self, state: RemoteConnectionState):
+        self._connection_state = state
+        self._is_connected = state is RemoteConnectionState.CONNECTED
+
     @property
     def is_connected(self) -> bool:
         """Check if WebSocket is connected and healthy."""
-        if (
-            self.connection_state != RemoteConnectionState.CONNECTED
-            or self.websocket is None
-        ):
+        if not self._is_connected or self.websocket is None:
             return False
 
-        # Check WebSocket state - import here to avoid circular imports
-        try:
-            from websockets.protocol import State
-
-            return self.websocket.state == State.OPEN
-        except ImportError:
-            # Fallback: assume connected if we have a websocket object
-            return True
+        return self.websocket.state is State.OPEN
 
     @property
     def websocket_url(self) -> str:
@@ -110,6 +200,123 @@ class RemoteWebSocketClient:
         protocol = "ws"  # Remote controllers typically use ws, not wss
         return f"{protocol}://{self.controller.host}:{self.controller.port}/api/ws/{self.controller.telescope_id}"
 
+    async def _resolve_address(self) -> str:
+        """Resolve the controller host once and reuse it across reconnects."""
+        key = (self.controller.host, self.controller.port)
+        address = self._address_cache.get(key)
+        if address is None:
+            infos = await self._loop.getaddrinfo(
+                *key, type=socket.SOCK_STREAM
+            )
+            address = infos[0][4][0]
+            self._address_cache[key] = address
+        return address
+
+    async def _open_websocket(self):
+        """Perform the WebSocket handshake with the remote controller."""
+        # The URL still supplies the Host header
+        return await websockets.connect(
+            self.websocket_url,
+            host=await self._resolve_address(),
+            port=self.controller.port,
+            ping_interval=self.controller.heartbeat_interval,
+            ping_timeout=10,
+            close_timeout=10,
+            max_size=MAX_FRAME_SIZE,
+            max_queue=MAX_QUEUED_FRAMES,
+            # Controllers without MessagePack support ignore the offer
+            subprotocols=[MSGPACK_SUBPROTOCOL] if msgpack is not None else None,
+            # Telemetry frames repeat the same keys, so keep the compression
+            # context across messages in both directions and use full-size
+            # windows rather than relying on the library defaults
+            extensions=[
+                ClientPerMessageDeflateFactory(
+                    server_max_window_bits=15,
+                    client_max_window_bits=15,
+                    compress_settings={"memLevel": 8},
+                )
+            ],
+        )
+
+    async def _take_standby(self):
+        """Adopt a warm standby connection, or return None if none is usable."""
+        while self._standby:
+            websocket = next(iter(self._standby))
+            holder = self._standby.pop(websocket)
+            holder.cancel()
+            await asyncio.gather(holder, return_exceptions=True)
+
+            if websocket.state is State.OPEN:
+                return websocket
+        return None
+
+    def _start_standby_fill(self):
+        """Top up the standby pool in the background."""
+        if self._standby_fill_task and not self._standby_fill_task.done():
+            return
+        self._standby_fill_task = self._loop.create_task(self._fill_standby())
+
+    async def _fill_standby(self):
+        """Open standby connections until the configured number are ready."""
+        while (
+            self.is_connected
+            and len(self._standby) < self.controller.standby_connections
+        ):
+            try:
+                websocket = await self._open_websocket()
+            except Exception as e:
+                logger.debug(f"Could not open standby connection: {e}")
+                return
+            self._standby[websocket] = self._loop.create_task(
+                self._hold_standby(websocket)
+            )
+
+    async def _hold_standby(self, websocket):
+        """
+        Keep a standby connection alive until it is adopted.
+
+        Inbound frames are discarded so the connection never stalls on a full
+        read queue, and a heartbeat is sent each interval so the controller
+        does not prune the idle connection.
+        """
+        interval = self.controller.heartbeat_interval
+        deadline = time.monotonic() + interval
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(
+                        websocket.recv(),
+                        timeout=max(deadline - time.monotonic(), 0),
+                    )
+                except asyncio.TimeoutError:
+                    now = time.monotonic()
+                    await websocket.send(
+                        _dumps(
+                            {
+                                "id": f"standby-{self._next_id()}",
+                                "type": "heartbeat",
+                                "timestamp": int(now * 1000),
+                            }
+                        )
+                    )
+                    deadline = now + interval
+        except (ConnectionClosed, OSError):
+            self._standby.pop(websocket, None)
+
+    async def _close_standby(self):
+        """Close all standby connections."""
+        if self._standby_fill_task:
+            self._standby_fill_task.cancel()
+            self._standby_fill_task = None
+
+        standby, self._standby = self._standby, {}
+        for websocket, holder in standby.items():
+            holder.cancel()
+            try:
+                await websocket.close()
+            except Exception:
+                pass
+
     async def connect(self) -> bool:
         """
         Connect to the remote controller WebSocket.
@@ -121,34 +328,46 @@ class RemoteWebSocketClient:
             return True
 
         if self.connection_state == RemoteConnectionState.CONNECTING:
-            return False
+            # Share the outcome of the attempt already in flight
+            await self._connect_event.wait()
+            return self.is_connected
 
         self.connection_state = RemoteConnectionState.CONNECTING
+        self._connect_event.clear()
+        self._loop = asyncio.get_running_loop()
 
         try:
             logger.info(f"Connecting to remote controller: {self.websocket_url}")
 
-            # Connect to remote WebSocket
-            self.websocket = await websockets.connect(
-                self.websocket_url,
-                ping_interval=self.controller.heartbeat_interval,
-                ping_timeout=10,
-                close_timeout=10,
-            )
+            # Prefer a warm standby connection over a fresh handshake
+            self.websocket = await self._take_standby()
+            if self.websocket is None:
+                self.websocket = await self._open_websocket()
+            self._use_msgpack = self.websocket.subprotocol == MSGPACK_SUBPROTOCOL
+            self._peer_batches = False
 
             self.connection_state = RemoteConnectionState.CONNECTED
             self.reconnect_attempts = 0
-            self.last_heartbeat = asyncio.get_event_loop().time()
-            self.last_message_time = asyncio.get_event_loop().time()
-
-            # Start message listener, heartbeat, and health check
-            asyncio.create_task(self._message_listener())
-            await self._start_heartbeat()
-            await self._start_health_check()
+            self.last_heartbeat = self.last_message_time = time.monotonic()
+
+            # Start message listener, outbound writer and connection health checks
+            self._listener_task = self._loop.create_task(self._message_listener())
+            self._outbox = asyncio.Queue()
+            self._writer_task = self._loop.create_task(self._writer_loop(self._outbox))
+            if self.message_handler and self._dispatch_task is None:
+                self._inbox = asyncio.Queue(MAX_INBOUND_MESSAGES)
+                self._dispatch_task = self._loop.create_task(
+                    self._dispatch_loop(self._inbox)
+                )
+            self._schedule_check()
+            self._schedule_heartbeat()
 
             # Restore subscriptions if any
             await self._restore_subscriptions()
 
+            if self.controller.standby_connections > 0:
+                self._start_standby_fill()
+
             logger.info(
                 f"Successfully connected to remote controller {self.controller.host}:{self.controller.port}"
             )
@@ -159,6 +378,8 @@ class RemoteWebSocketClient:
                 f"Failed to connect to remote controller {self.controller.host}:{self.controller.port}: {e}"
             )
             self.connection_state = RemoteConnectionState.ERROR
+            # The host may have moved; resolve it again on the next attempt
+            self._address_cache.pop((self.controller.host, self.controller.port), None)
             await self._schedule_reconnect()
             return False
         except Exception as e:
@@ -166,6 +387,8 @@ class RemoteWebSocketClient:
             self.connection_state = RemoteConnectionState.ERROR
             await self._schedule_reconnect()  # Always try to reconnect on any failure
             return False
+        finally:
+            self._connect_event.set()
 
     async def disconnect(self):
         """Disconnect from remote controller."""
@@ -173,19 +396,23 @@ class RemoteWebSocketClient:
             f"Disconnecting from remote controller {self.controller.host}:{self.controller.port}"
         )
 
+        # Mark the disconnect as intentional before closing, so the listener
+        # does not treat the close as a lost connection
+        self.connection_state = RemoteConnectionState.DISCONNECTED
+
         # Cancel reconnection attempts
         if self.reconnect_task:
             self.reconnect_task.cancel()
             self.reconnect_task = None
 
-        # Cancel heartbeat and health check
-        if self.heartbeat_task:
-            self.heartbeat_task.cancel()
-            self.heartbeat_task = None
+        # Stop connection health checks, the listener, the outbound writer and
+        # the inbound dispatcher
+        self._cancel_check()
+        self._stop_listener()
+        self._stop_writer()
+        self._stop_dispatcher()
 
-        if self.health_check_task:
-            self.health_check_task.cancel()
-            self.health_check_task = None
+        await self._close_standby()
 
         # Close WebSocket connection
         if self.websocket:
@@ -196,8 +423,6 @@ class RemoteWebSocketClient:
             finally:
                 self.websocket = None
 
-        self.connection_state = RemoteConnectionState.DISCONNECTED
-
         # Reject pending messages
         for future in self.pending_messages.values():
             if not future.done():
@@ -217,52 +442,164 @@ class RemoteWebSocketClient:
         if not self.is_connected:
             raise ConnectionError("Not connected to remote controller")
 
+        # If this is a command that expects a response, register for it before
+        # sending so a fast reply cannot arrive ahead of its future
+        future = None
+        message_id = message.get("id")
+        if (
+            message_id
+            and message.get("type") == "control_command"
+            and message.get("payload", {}).get("response_expected")
+        ):
+            if len(self.pending_messages) >= MAX_PENDING_MESSAGES:
+                _, oldest = self.pending_messages.popitem(last=False)
+                if not oldest.done():
+                    oldest.set_exception(asyncio.TimeoutError())
+            future = self._loop.create_future()
+            self.pending_messages[message_id] = future
+
         try:
-            message_str = json.dumps(message)
-            await self.websocket.send(message_str)
-
-            # If this is a command that expects a response, wait for it
-            if message.get("type") == "control_command" and message.get(
-                "payload", {}
-            ).get("response_expected"):
-                message_id = message.get("id")
-                if message_id:
-                    # Create future for response
-                    future = asyncio.Future()
-                    self.pending_messages[message_id] = future
-
-                    try:
-                        # Wait for response with timeout
-                        response = await asyncio.wait_for(future, timeout=10.0)
-                        return response
-                    except asyncio.TimeoutError:
-                        logger.warning(
-                            f"Timeout waiting for response to message {message_id}"
-                        )
-                        self.pending_messages.pop(message_id, None)
-                        raise
+            await self._write(message)
+
+            if future is None:
+                return None
 
-            return None
+            try:
+                # Wait for response with timeout
+                return await asyncio.wait_for(future, timeout=10.0)
+            except asyncio.TimeoutError:
+                logger.warning("Timeout waiting for response to message %s", message_id)
+                raise
 
         except ConnectionClosed:
             logger.warning("WebSocket connection closed while sending message")
             await self._handle_disconnection()
             raise ConnectionError("WebSocket connection lost")
         except Exception as e:
-            logger.error(f"Error sending message to remote controller: {e}")
+            logger.error("Error sending message to remote controller: %s", e)
             raise
+        finally:
+            if future is not None:
+                self.pending_messages.pop(message_id, None)
+
+    def _encode(self, message: Dict[str, Any]):
+        """Encode a message for the negotiated wire format."""
+        return pack_message(message) if self._use_msgpack else _dumps(message)
+
+    async def _write(self, message: Dict[str, Any]):
+        """Queue a message for the writer task and wait until it is sent."""
+        if self._writer_task is None:
+            await self.websocket.send(self._encode(message))
+            return
+
+        sent = self._loop.create_future()
+        self._outbox.put_nowait((message, sent))
+        await sent
+
+    async def _writer_loop(self, outbox: asyncio.Queue):
+        """
+        Send queued messages, coalescing whatever is already waiting.
+
+        Everything queued while the previous send was in flight goes out as one
+        batch frame when the controller supports it, so bursts of commands cost
+        a single frame rather than one each.
+        """
+        while True:
+            batch = [await outbox.get()]
+            while len(batch) < MAX_BATCH_MESSAGES:
+                try:
+                    batch.append(outbox.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                if len(batch) > 1 and self._peer_batches:
+                    await self.websocket.send(
+                        self._encode(
+                            {
+                                "id": f"batch-{self._next_id()}",
+                                "type": "batch",
+                                "payload": {"items": [message for message, _ in batch]},
+                            }
+                        )
+                    )
+                    for _, sent in batch:
+                        if not sent.done():
+                            sent.set_result(None)
+                else:
+                    for message, sent in batch:
+                        await self.websocket.send(self._encode(message))
+                        if not sent.done():
+                            sent.set_result(None)
+            except asyncio.CancelledError:
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_exception(ConnectionError("WebSocket disconnected"))
+                raise
+            except Exception as e:
+                for _, sent in batch:
+                    if not sent.done():
+                        sent.set_exception(e)
+
+    def _stop_writer(self):
+        """Stop the writer task and fail anything still queued."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+
+        outbox, self._outbox = self._outbox, None
+        while outbox is not None and not outbox.empty():
+            _, sent = outbox.get_nowait()
+            if not sent.done():
+                sent.set_exception(ConnectionError("WebSocket disconnected"))
+
+    async def _dispatch(self, message: Dict[str, Any]):
+        """Pass a message to the message handler."""
+        try:
+            # One remote connection can carry several telescopes' updates
+            await self.message_handler(
+                message.get("telescope_id") or self.controller.telescope_id, message
+            )
+        except Exception as e:
+            logger.error("Error in message handler: %s", e)
+
+    async def _dispatch_loop(self, inbox: asyncio.Queue):
+        """Deliver queued messages in order, so a slow handler never stalls the listener."""
+        while True:
+            await self._dispatch(await inbox.get())
+
+    def _enqueue_inbound(self, message: Dict[str, Any]):
+        """Queue a message for the dispatcher, dropping the oldest when full."""
+        if self._inbox.full():
+            self._inbox.get_nowait()
+            self.dropped_messages += 1
+            if self.dropped_messages % MAX_INBOUND_MESSAGES == 1:
+                logger.warning(
+                    "Message handler for %s is falling behind; %d messages dropped",
+                    self.controller.telescope_id,
+                    self.dropped_messages,
+                )
+        self._inbox.put_nowait(message)
+
+    def _stop_dispatcher(self):
+        """Stop the dispatcher task and discard anything still queued."""
+        if self._dispatch_task:
+            self._dispatch_task.cancel()
+            self._dispatch_task = None
+        self._inbox = None
 
     async def send_subscription(
         self, subscription_types: list, telescope_id: str = None
     ):
         """Send subscription message to remote controller."""
         target_telescope_id = telescope_id or self.controller.telescope_id
+        now = time.monotonic()
 
         subscription_message = {
-            "id": f"sub-{asyncio.get_event_loop().time()}",
+            "id": f"sub-{self._next_id()}",
             "type": "subscribe",
             "telescope_id": target_telescope_id,
-            "timestamp": int(asyncio.get_event_loop().time() * 1000),
+            "timestamp": int(now * 1000),
             "payload": {
                 "subscription_types": subscription_types,
                 "all_telescopes": False,
@@ -273,7 +610,33 @@ class RemoteWebSocketClient:
 
         # Track subscription for restoration after reconnect
         self.active_subscriptions[target_telescope_id] = subscription_types
-        logger.debug(f"Sent subscription to remote controller: {subscription_types}")
+        logger.debug("Sent subscription to remote controller: %s", subscription_types)
+
+    async def send_subscriptions(self, subscriptions: Dict[str, list]):
+        """Send subscriptions for several telescopes in a single frame."""
+        now = time.monotonic()
+        subscription_message = {
+            "id": f"sub-bulk-{self._next_id()}",
+            "type": "subscribe_bulk",
+            "timestamp": int(now * 1000),
+            "payload": {
+                "subscriptions": [
+                    {
+                        "telescope_id": telescope_id,
+                        "subscription_types": subscription_types,
+                    }
+                    for telescope_id, subscription_types in subscriptions.items()
+                ],
+            },
+        }
+
+        await self.send_message(subscription_message)
+
+        self.active_subscriptions.update(subscriptions)
+        logger.debug(
+            "Sent bulk subscription to remote controller for %d telescopes",
+            len(subscriptions),
+        )
 
     def force_reconnect(self, reason: str = "Manual reconnection requested"):
         """Force reconnection (public method for external use)."""
@@ -281,12 +644,25 @@ class RemoteWebSocketClient:
             f"Forcing reconnection for {self.controller.host}:{self.controller.port}: {reason}"
         )
 
-        # Create task to handle disconnection asynchronously
-        asyncio.create_task(self._handle_disconnection())
+        # Handle disconnection asynchronously
+        self._spawn_disconnection()
+
+    def _spawn_disconnection(self) -> asyncio.Task:
+        """Start disconnection handling, joining one that is already running."""
+        if self._disconnect_task is None or self._disconnect_task.done():
+            loop = self._loop or asyncio.get_event_loop()
+            self._disconnect_task = loop.create_task(self._handle_disconnection())
+        return self._disconnect_task
+
+    def _stop_listener(self):
+        """Cancel the message listener unless it is the caller."""
+        task, self._listener_task = self._listener_task, None
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
 
     def get_health_status(self) -> dict:
         """Get current health status information."""
-        current_time = asyncio.get_event_loop().time()
+        current_time = time.monotonic()
         return {
             "is_connected": self.is_connected,
             "connection_state": self.connection_state.value,
@@ -295,32 +671,42 @@ class RemoteWebSocketClient:
             "last_heartbeat": self.last_heartbeat,
             "time_since_last_message": current_time - self.last_message_time,
             "time_since_last_heartbeat": current_time - self.last_heartbeat,
-            "active_subscriptions": dict(self.active_subscriptions),
+            "dropped_messages": self.dropped_messages,
+            # Read-only view rather than a copy; callers only read it
+            "active_subscriptions": MappingProxyType(self.active_subscriptions),
         }
 
     async def _message_listener(self):
         """Listen for messages from remote controller."""
         try:
-            async for message_str in self.websocket:
+            async for frame in self.websocket:
                 try:
-                    message = json.loads(message_str)
+                    # Binary frames carry MessagePack; text frames are JSON
+                    if isinstance(frame, bytes):
+                        message = unpack_message(frame)
+                    else:
+                        message = _loads(frame)
                     await self._handle_remote_message(message)
-                except json.JSONDecodeError as e:
-                    logger.warning(f"Invalid JSON from remote controller: {e}")
+                except _JSONDecodeError as e:
+                    logger.warning("Invalid JSON from remote controller: %s", e)
                 except Exception as e:
-                    logger.error(f"Error handling remote message: {e}")
+                    logger.error("Error handling remote message: %s", e)
 
         except ConnectionClosed:
             logger.info("Remote controller WebSocket connection closed")
             await self._handle_disconnection()
         except Exception as e:
-            logger.error(f"Error in message listener: {e}")
+            logger.error("Error in message listener: %s", e)
+            await self._handle_disconnection()
+        else:
+            # A clean close from the controller ends iteration without raising
+            logger.info("Remote controller WebSocket connection closed")
             await self._handle_disconnection()
 
     async def _handle_remote_message(self, message: Dict[str, Any]):
         """Handle message received from remote controller."""
         # Update message timestamp for health monitoring
-        self.last_message_time = asyncio.get_event_loop().time()
+        self.last_message_time = time.monotonic()
 
         message_type = message.get("type")
         message_id = message.get("id")
@@ -328,83 +714,153 @@ class RemoteWebSocketClient:
         # Handle command responses
         if message_type == "command_response":
             command_id = message.get("payload", {}).get("command_id")
-            if command_id and command_id in self.pending_messages:
-                future = self.pending_messages.pop(command_id)
+            future = self.pending_messages.pop(command_id, None)
+            if future is not None:
                 if not future.done():
                     future.set_result(message)
                 return
 
         # Handle heartbeat responses
         if message_type == "heartbeat":
-            self.last_heartbeat = asyncio.get_event_loop().time()
+            self.last_heartbeat = self.last_message_time
+            self._peer_batches = "batch" in message.get("payload", {}).get(
+                "features", ()
+            )
             return
 
         # Forward other messages to the message handler
         if self.message_handler:
-            try:
-                await self.message_handler(self.controller.telescope_id, message)
-            except Exception as e:
-                logger.error(f"Error in message handler: {e}")
+            if self._inbox is not None:
+                self._enqueue_inbound(message)
+            else:
+                await self._dispatch(message)
+
+    def _schedule_check(self, delay: Optional[float] = None):
+        """Schedule the next connection health check on the event loop."""
+        if delay is None:
+            delay = min(
+                self.controller.heartbeat_interval,
+                self.controller.health_check_interval,
+            )
+        self._check_handle = self._loop.call_later(delay, self._on_check)
+
+    def _cancel_check(self):
+        """Drop the pending health check and outbound heartbeat, if any."""
+        if self._check_handle:
+            self._check_handle.cancel()
+            self._check_handle = None
+        if self._heartbeat_handle:
+            self._heartbeat_handle.cancel()
+            self._heartbeat_handle = None
+
+    def _schedule_heartbeat(self):
+        """Schedule the next outbound heartbeat on the event loop."""
+        self._heartbeat_handle = self._loop.call_later(
+            self.controller.heartbeat_interval, self._on_heartbeat
+        )
 
-    async def _start_heartbeat(self):
-        """Start heartbeat monitoring."""
-        if self.heartbeat_task:
-            self.heartbeat_task.cancel()
+    def _on_heartbeat(self):
+        """
+        Queue a heartbeat for the controller.
 
-        self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        The controller prunes connections it has not heard from within two of
+        its own heartbeat intervals, and protocol-level pings do not count, so
+        a client that only receives would otherwise be dropped.
+        """
+        self._heartbeat_handle = None
+        if not self.is_connected or self._outbox is None:
+            return
 
-    async def _heartbeat_loop(self):
-        """Heartbeat monitoring loop."""
-        try:
-            while self.is_connected:
-                await asyncio.sleep(self.controller.heartbeat_interval)
+        sent = self._loop.create_future()
+        # Nobody awaits a heartbeat; a failed send surfaces through the listener
+        sent.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._outbox.put_nowait(
+            (
+                {
+                    "id": f"heartbeat-{self._next_id()}",
+                    "type": "heartbeat",
+                    "timestamp": int(time.monotonic() * 1000),
+                },
+                sent,
+            )
+        )
+        self._schedule_heartbeat()
 
-                if not self.is_connected:
-                    break
+    def _on_check(self):
+        """
+        Check heartbeat and message freshness.
 
-                # Check if we've received a recent heartbeat
-                current_time = asyncio.get_event_loop().time()
-                if (
-                    current_time - self.last_heartbeat
-                    > self.controller.heartbeat_interval * 2
-                ):
-                    logger.warning("Heartbeat timeout from remote controller")
-                    await self._handle_disconnection()
-                    break
+        Inbound frames only record their arrival time; this callback reads those
+        timestamps and re-arms itself for the earliest deadline, so no timer is
+        cancelled or recreated per frame.
+        """
+        self._check_handle = None
+        if not self.is_connected:
+            return
 
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            logger.error(f"Error in heartbeat loop: {e}")
+        current_time = time.monotonic()
+        heartbeat_deadline = self.last_heartbeat + self.controller.heartbeat_interval * (
+            MAX_MISSED_HEARTBEATS + 1
+        )
+        message_deadline = self.last_message_time + self.controller.message_timeout
+        time_since_last_message = current_time - self.last_message_time
+
+        if current_time > heartbeat_deadline:
+            logger.warning("Heartbeat timeout from remote controller")
+        elif current_time > message_deadline:
+            logger.warning(
+                "Health check failed: No messages received for %.1fs (limit: %ss)",
+                time_since_last_message,
+                self.controller.message_timeout,
+            )
+        else:
+            logger.debug(
+                "Health check passed for %s:%d - last message %.1fs ago",
+                self.controller.host,
+                self.controller.port,
+                time_since_last_message,
+            )
+            self._schedule_check(
+                min(heartbeat_deadline, message_deadline) - current_time
+            )
+            return
+
+        self._spawn_disconnection()
 
     async def _handle_disconnection(self):
         """Handle unexpected disconnection."""
-        if self.connection_state == RemoteConnectionState.DISCONNECTED:
+        # The listener, health check, senders and force_reconnect can all report
+        # the same loss; only the first does the work. The check and the flag
+        # are set before any await, so no lock is needed on a single loop.
+        if self._handling_disconnect or self.connection_state in (
+            RemoteConnectionState.DISCONNECTED,
+            RemoteConnectionState.RECONNECTING,
+        ):
             return
+        self._handling_disconnect = True
 
-        logger.warning(
-            f"Remote controller connection lost: {self.controller.host}:{self.controller.port}"
-        )
-        self.connection_state = RemoteConnectionState.ERROR
-
-        # Clean up
-        if self.heartbeat_task:
-            self.heartbeat_task.cancel()
-            self.heartbeat_task = None
+        try:
+            logger.warning(
+                f"Remote controller connection lost: {self.controller.host}:{self.controller.port}"
+            )
+            self.connection_state = RemoteConnectionState.ERROR
 
-        if self.health_check_task:
-            self.health_check_task.cancel()
-            self.health_check_task = None
+            # Clean up
+            self._cancel_check()
+            self._stop_listener()
+            self._stop_writer()
 
-        if self.websocket:
-            try:
-                await self.websocket.close()
-            except:
-                pass
-            self.websocket = None
+            if self.websocket:
+                try:
+                    await self.websocket.close()
+                except:
+                    pass
+                self.websocket = None
 
-        # Schedule reconnection
-        await self._schedule_reconnect()
+            # Schedule reconnection
+            await self._schedule_reconnect()
+        finally:
+            self._handling_disconnect = False
 
     async def _schedule_reconnect(self):
         """Schedule reconnection attempt."""
@@ -426,6 +882,9 @@ class RemoteWebSocketClient:
             * (2 ** min(self.reconnect_attempts - 1, 5)),
             60.0,
         )
+        if self._standby:
+            # A warm connection is ready, so there is no handshake to back off from
+            delay = 0
 
         if self.controller.max_reconnect_attempts < 0:
             logger.info(
@@ -450,42 +909,6 @@ class RemoteWebSocketClient:
             logger.error(f"Error during reconnection: {e}")
             await self._schedule_reconnect()
 
-    async def _start_health_check(self):
-        """Start health check monitoring."""
-        if self.health_check_task:
-            self.health_check_task.cancel()
-
-        self.health_check_task = asyncio.create_task(self._health_check_loop())
-
-    async def _health_check_loop(self):
-        """Health check monitoring loop."""
-        try:
-            while self.is_connected:
-                await asyncio.sleep(self.controller.health_check_interval)
-
-                if not self.is_connected:
-                    break
-
-                current_time = asyncio.get_event_loop().time()
-                time_since_last_message = current_time - self.last_message_time
-
-                # Check if we haven't received any messages within the timeout period
-                if time_since_last_message > self.controller.message_timeout:
-                    logger.warning(
-                        f"Health check failed: No messages received for {time_since_last_message:.1f}s (limit: {self.controller.message_timeout}s)"
-                    )
-                    await self._handle_disconnection()
-                    break
-                else:
-                    logger.debug(
-                        f"Health check passed for {self.controller.host}:{self.controller.port} - last message {time_since_last_message:.1f}s ago"
-                    )
-
-        except asyncio.CancelledError:
-            pass
-        except Exception as e:
-            logger.error(f"Error in health check loop: {e}")
-
     async def _restore_subscriptions(self):
         """Restore subscriptions after reconnection."""
         if not self.active_subscriptions:
@@ -495,7 +918,12 @@ class RemoteWebSocketClient:
             f"Restoring {len(self.active_subscriptions)} subscriptions after reconnection"
         )
 
-        for telescope_id, subscription_types in self.active_subscriptions.items():
+        # A lone subscription keeps the plain subscribe frame so controllers
+        # without subscribe_bulk support still recover the common case
+        if len(self.active_subscriptions) == 1:
+            telescope_id, subscription_types = next(
+                iter(self.active_subscriptions.items())
+            )
             try:
                 await self.send_subscription(subscription_types, telescope_id)
                 logger.debug(
@@ -505,6 +933,12 @@ class RemoteWebSocketClient:
                 logger.error(
                     f"Failed to restore subscription for telescope {telescope_id}: {e}"
                 )
+            return
+
+        try:
+            await self.send_subscriptions(self.active_subscriptions)
+        except Exception as e:
+            logger.error(f"Failed to restore subscriptions: {e}")
 
 
 class RemoteWebSocketManager:
@@ -514,15 +948,31 @@ class RemoteWebSocketManager:
         self, message_handler: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ):
         self.clients: Dict[str, RemoteWebSocketClient] = {}
+        # telescope_id -> client, kept in step with clients
+        self._by_telescope: Dict[str, RemoteWebSocketClient] = {}
         self.message_handler = message_handler
+        self._address_cache: Dict[Tuple[str, int], str] = {}
 
     async def add_remote_controller(self, controller: RemoteController) -> bool:
         """Add and connect to a remote controller."""
-        if controller.controller_id in self.clients:
-            return self.clients[controller.controller_id].is_connected
+        client = self.clients.get(controller.controller_id)
+        if client is not None:
+            # Telescopes on one remote share its connection; wait for any
+            # handshake still in flight instead of reporting it as failed
+            self._by_telescope[controller.telescope_id] = client
+            success = await client.connect()
+            if success:
+                # Subscribe this telescope on the shared connection too
+                await client.send_subscription(
+                    ["all"], telescope_id=controller.telescope_id
+                )
+            return success
 
-        client = RemoteWebSocketClient(controller, self.message_handler)
+        client = RemoteWebSocketClient(
+            controller, self.message_handler, self._address_cache
+        )
         self.clients[controller.controller_id] = client
+        self._by_telescope[controller.telescope_id] = client
 
         success = await client.connect()
         if success:
@@ -531,19 +981,45 @@ class RemoteWebSocketManager:
 
         return success
 
+    async def add_remote_controllers(
+        self, controllers: List[RemoteController]
+    ) -> List[bool]:
+        """Add and connect to several remote controllers concurrently."""
+        handshake_slots = asyncio.Semaphore(MAX_CONCURRENT_HANDSHAKES)
+
+        async def add(controller: RemoteController) -> bool:
+            async with handshake_slots:
+                return await self.add_remote_controller(controller)
+
+        results = await asyncio.gather(
+            *(add(controller) for controller in controllers), return_exceptions=True
+        )
+        for controller, result in zip(controllers, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Failed to add remote controller {controller.controller_id}: {result}"
+                )
+        return [result is True for result in results]
+
     async def remove_remote_controller(self, controller_id: str):
         """Remove and disconnect from a remote controller."""
         if controller_id in self.clients:
             client = self.clients.pop(controller_id)
+            for telescope_id in [
+                telescope_id
+                for telescope_id, indexed in self._by_telescope.items()
+                if indexed is client
+            ]:
+                del self._by_telescope[telescope_id]
             await client.disconnect()
 
     async def send_to_telescope(
         self, telescope_id: str, message: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
         """Send message to telescope via appropriate remote controller."""
-        for client in self.clients.values():
-            if client.controller.telescope_id == telescope_id and client.is_connected:
-                return await client.send_message(message)
+        client = self._by_telescope.get(telescope_id)
+        if client is not None and client.is_connected:
+            return await client.send_message(message)
 
         raise ConnectionError(
             f"No connected remote controller for telescope {telescope_id}"
@@ -551,28 +1027,44 @@ class RemoteWebSocketManager:
 
     def get_telescope_connection_status(self, telescope_id: str) -> str:
         """Get connection status for a telescope."""
-        for client in self.clients.values():
-            if client.controller.telescope_id == telescope_id:
-                return client.connection_state.value
+        client = self._by_telescope.get(telescope_id)
+        if client is not None:
+            return client.connection_state.value
 
         return "disconnected"
 
     async def disconnect_all(self):
         """Disconnect from all remote controllers."""
-        disconnect_tasks = [client.disconnect() for client in self.clients.values()]
-        if disconnect_tasks:
-            await asyncio.gather(*disconnect_tasks, return_exceptions=True)
+        # Closing handshakes are bounded like opening ones
+        handshake_slots = asyncio.Semaphore(MAX_CONCURRENT_HANDSHAKES)
+
+        async def disconnect(client: RemoteWebSocketClient):
+            async with handshake_slots:
+                # A failed close is logged rather than raised, so the task
+                # group doesn't cancel the other controllers' disconnects
+                try:
+                    await client.disconnect()
+                except Exception as e:
+                    logger.error(
+                        f"Error disconnecting remote controller {client.controller.controller_id}: {e}"
+                    )
+
+        async with asyncio.TaskGroup() as tg:
+            for client in self.clients.values():
+                tg.create_task(disconnect(client))
         self.clients.clear()
+        self._by_telescope.clear()
+        self._address_cache.clear()
 
     def force_reconnect_telescope(
         self, telescope_id: str, reason: str = "Manual reconnection requested"
     ):
         """Force reconnection for a specific telescope."""
-        for client in self.clients.values():
-            if client.controller.telescope_id == telescope_id:
-                client.force_reconnect(reason)
-                return True
-        return False
+        client = self._by_telescope.get(telescope_id)
+        if client is None:
+            return False
+        client.force_reconnect(reason)
+        return True
 
     def get_all_health_status(self) -> Dict[str, dict]:
         """Get health status for all remote controllers."""
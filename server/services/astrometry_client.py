@@ -4,7 +4,10 @@ Astrometry.net client for plate solving telescope images.
 
 import json
 import asyncio
-from typing import Optional, Dict, Any
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 import numpy as np
 import cv2
 
@@ -47,6 +50,26 @@ class PlateSolveResult(BaseModel):
     submission_id: Optional[int] = None
 
 
+# Successful solves, keyed by image and upload parameters, so retries and repeated requests
+# for the same frame skip the upload; shared because clients are per-solve
+SOLVE_CACHE_SIZE = 32
+SOLVE_CACHE_TTL = 300.0
+_solve_cache: OrderedDict[bytes, Tuple[float, PlateSolveResult]] = OrderedDict()
+
+# Configured API URL -> the URL that last accepted a login, so later logins
+# skip an endpoint that is known to fail
+_known_good_urls: Dict[str, str] = {}
+
+
+def _solve_digest(image: np.ndarray, params: Dict[str, Any]) -> bytes:
+    """Hash the pixel data, shape and dtype of an image with its solve parameters."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    digest.update(f"{image.shape}{image.dtype}".encode())
+    digest.update(np.ascontiguousarray(image))
+    return digest.digest()
+
+
 class AstrometryClient:
     """Client for interacting with astrometry.net API."""
 
@@ -58,16 +81,30 @@ class AstrometryClient:
             "User-Agent": "ALP-Experimental-Telescope-Control/1.0",
             "Accept": "application/json",
         }
-        self.client = httpx.AsyncClient(timeout=300.0, headers=headers)
+        # Status polls go to the same host; keep connections alive between
+        # them and multiplex over HTTP/2 when the endpoint is HTTPS
+        self.client = httpx.AsyncClient(
+            timeout=300.0,
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0),
+        )
 
     async def login(self) -> bool:
         """Login to astrometry.net and get session key."""
         # Try both HTTP and HTTPS endpoints
-        urls_to_try = [self.settings.api_url]
-        if self.settings.api_url.startswith("http://"):
-            https_url = self.settings.api_url.replace("http://", "https://")
+        configured_url = self.settings.api_url
+        urls_to_try = [configured_url]
+        if configured_url.startswith("http://"):
+            https_url = configured_url.replace("http://", "https://")
             urls_to_try.append(https_url)
-        
+
+        # Start with whichever endpoint worked last time
+        known_good_url = _known_good_urls.get(configured_url)
+        if known_good_url in urls_to_try:
+            urls_to_try.remove(known_good_url)
+            urls_to_try.insert(0, known_good_url)
+
         for api_url in urls_to_try:
             try:
                 logger.info(f"Attempting login to: {api_url}login")
@@ -93,6 +130,7 @@ class AstrometryClient:
                     self.session_key = data.get("session")
                     # Update the API URL to the working one
                     self.settings.api_url = api_url
+                    _known_good_urls[configured_url] = api_url
                     logger.info(f"Successfully logged in to astrometry.net using {api_url}")
                     return True
                 else:
@@ -108,6 +146,50 @@ class AstrometryClient:
         logger.error("Failed to login using all available URLs")
         return False
 
+    @property
+    def settings(self) -> AstrometrySettings:
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: AstrometrySettings):
+        # Replace the settings rather than mutating their submission fields,
+        # so the upload parameter template stays in sync
+        self._settings = settings
+        self._params_template = self._build_params_template(settings)
+
+    @staticmethod
+    def _build_params_template(settings: AstrometrySettings) -> Dict[str, Any]:
+        """Build the upload parameters that depend only on the settings."""
+        params: Dict[str, Any] = {
+            "allow_commercial_use": "n",
+            "allow_modifications": "n",
+            "publicly_visible": "n",
+        }
+
+        # Add optional parameters
+        if settings.scale_low is not None:
+            params["scale_lower"] = settings.scale_low
+        if settings.scale_high is not None:
+            params["scale_upper"] = settings.scale_high
+        if settings.scale_units:
+            params["scale_units"] = settings.scale_units
+        if settings.center_ra is not None:
+            params["center_ra"] = settings.center_ra
+        if settings.center_dec is not None:
+            params["center_dec"] = settings.center_dec
+        if settings.radius is not None:
+            params["radius"] = settings.radius
+        if settings.downsample_factor is not None:
+            params["downsample_factor"] = settings.downsample_factor
+        if settings.tweak_order is not None:
+            params["tweak_order"] = settings.tweak_order
+        if settings.crpix_center:
+            params["crpix_center"] = True
+        if settings.parity is not None:
+            params["parity"] = settings.parity
+
+        return params
+
     def _prepare_image(self, scope_image: ScopeImage) -> bytes:
         """Convert ScopeImage to JPEG bytes for upload."""
         if scope_image.image is None:
@@ -116,25 +198,18 @@ class AstrometryClient:
         # Convert to uint8 if needed
         image = scope_image.image
         if image.dtype != np.uint8:
-            # Normalize to 0-255 range
-            image = ((image - image.min()) / (image.max() - image.min()) * 255).astype(
-                np.uint8
+            # Stretch to 0-255 in one pass; constant frames come out all zeros
+            image = cv2.normalize(
+                image, None, 0, 255, cv2.NORM_MINMAX, dtype=cv2.CV_8U
             )
 
-        # Ensure it's BGR for OpenCV
-        if len(image.shape) == 2:
-            # Grayscale
-            image_bgr = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
-        elif image.shape[2] == 3:
-            # Already RGB/BGR
-            image_bgr = image
-        else:
+        # Grayscale frames are encoded as single-channel JPEGs; astrometry.net
+        # only uses luminance, so there is no need to expand them to BGR
+        if len(image.shape) != 2 and image.shape[2] != 3:
             raise ValueError(f"Unsupported image shape: {image.shape}")
 
         # Encode as JPEG
-        success, encoded = cv2.imencode(
-            ".jpg", image_bgr, [cv2.IMWRITE_JPEG_QUALITY, 90]
-        )
+        success, encoded = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, 90])
         if not success:
             raise ValueError("Failed to encode image as JPEG")
 
@@ -147,42 +222,19 @@ class AstrometryClient:
                 return None
 
         try:
-            # Prepare image data
-            image_data = self._prepare_image(scope_image)
+            # Encode on a worker thread so large frames don't stall the event loop
+            image_data = await asyncio.get_running_loop().run_in_executor(
+                None, self._prepare_image, scope_image
+            )
 
-            # Prepare submission parameters
+            # Settings-derived parameters are precomputed; add the session and
+            # let kwargs override them
             submission_params = {
+                **self._params_template,
                 "session": self.session_key,
-                "allow_commercial_use": "n",
-                "allow_modifications": "n",
-                "publicly_visible": "n",
+                **kwargs,
             }
 
-            # Add optional parameters
-            if self.settings.scale_low is not None:
-                submission_params["scale_lower"] = self.settings.scale_low
-            if self.settings.scale_high is not None:
-                submission_params["scale_upper"] = self.settings.scale_high
-            if self.settings.scale_units:
-                submission_params["scale_units"] = self.settings.scale_units
-            if self.settings.center_ra is not None:
-                submission_params["center_ra"] = self.settings.center_ra
-            if self.settings.center_dec is not None:
-                submission_params["center_dec"] = self.settings.center_dec
-            if self.settings.radius is not None:
-                submission_params["radius"] = self.settings.radius
-            if self.settings.downsample_factor is not None:
-                submission_params["downsample_factor"] = self.settings.downsample_factor
-            if self.settings.tweak_order is not None:
-                submission_params["tweak_order"] = self.settings.tweak_order
-            if self.settings.crpix_center:
-                submission_params["crpix_center"] = True
-            if self.settings.parity is not None:
-                submission_params["parity"] = self.settings.parity
-
-            # Override with any kwargs
-            submission_params.update(kwargs)
-
             # Upload file
             files = {"file": ("image.jpg", image_data, "image/jpeg")}
             response = await self.client.post(
@@ -239,10 +291,13 @@ class AstrometryClient:
         self, submission_id: int, timeout: float = 180.0
     ) -> PlateSolveResult:
         """Wait for plate solving to complete and return results."""
-        start_time = asyncio.get_event_loop().time()
+        now = asyncio.get_running_loop().time
+        start_time = now()
         job_id = None
+        # Poll quickly at first, backing off to every 5 seconds for slow solves
+        delay = 0.5
 
-        while asyncio.get_event_loop().time() - start_time < timeout:
+        while now() - start_time < timeout:
             # Check submission status
             status = await self.get_submission_status(submission_id)
             if not status:
@@ -255,6 +310,8 @@ class AstrometryClient:
             if jobs and job_id is None:
                 job_id = jobs[0]
                 logger.info(f"Job ID: {job_id}")
+                # A new job is the most likely to finish soon
+                delay = 0.5
 
             # Check if job is done
             if job_id:
@@ -298,7 +355,8 @@ class AstrometryClient:
                         )
 
             # Wait before checking again
-            await asyncio.sleep(5.0)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 5.0)
 
         return PlateSolveResult(
             success=False,
@@ -309,13 +367,37 @@ class AstrometryClient:
 
     async def solve_image(self, scope_image: ScopeImage, **kwargs) -> PlateSolveResult:
         """Complete plate solving workflow for an image."""
+        key = None
+        if scope_image.image is not None:
+            # Hints and settings change the solve, so they are part of the key
+            params = {
+                "api_url": self.settings.api_url,
+                **self._params_template,
+                **kwargs,
+            }
+            key = await asyncio.get_running_loop().run_in_executor(
+                None, _solve_digest, scope_image.image, params
+            )
+            cached = _solve_cache.get(key)
+            if cached and time.monotonic() - cached[0] < SOLVE_CACHE_TTL:
+                logger.info("Using cached plate solve result for identical image")
+                _solve_cache.move_to_end(key)
+                return cached[1]
+
         # Upload image
         submission_id = await self.upload_image(scope_image, **kwargs)
         if not submission_id:
             return PlateSolveResult(success=False, error="Failed to upload image")
 
         # Wait for results
-        return await self.wait_for_solve(submission_id)
+        result = await self.wait_for_solve(submission_id)
+
+        if result.success and key is not None:
+            _solve_cache[key] = (time.monotonic(), result)
+            _solve_cache.move_to_end(key)
+            while len(_solve_cache) > SOLVE_CACHE_SIZE:
+                _solve_cache.popitem(last=False)
+        return result
 
     async def close(self):
         """Close the HTTP client."""
@@ -2,8 +2,15 @@
 
 import asyncio
 import functools
+import hashlib
+import itertools
+import json
+import os
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
+import cv2
 import numpy as np
 from loguru import logger as logging
 
@@ -13,32 +20,121 @@ from smarttel.imaging.stretch import StretchParameter
 from smarttel.imaging.fits_handler import FITSHandler
 
 
-# Global thread pool for CPU-intensive tasks
+# Global thread pools: CPU-bound stretching/enhancement, and I/O-bound
+# FITS reads and image encoding, so neither workload queues behind the other
 _cpu_executor: Optional[ThreadPoolExecutor] = None
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+# One GraxpertStretch per worker thread, reconfigured on every call
+_graxpert_pool = threading.local()
+
+# Recent GraXpert results, keyed by a digest of the input pixels and settings,
+# so re-requesting a view with unchanged settings skips the pipeline. Bounded
+# by total size since a single processed frame can be tens of megabytes.
+GRAXPERT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_graxpert_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+_graxpert_cache_bytes = 0
 
 
 def get_cpu_executor() -> ThreadPoolExecutor:
     """Get or create the global CPU thread pool executor."""
     global _cpu_executor
     if _cpu_executor is None:
-        # Use number of CPU cores, but limit to reasonable max
-        import os
-        max_workers = min(os.cpu_count() or 4, 8)
+        # Half the cores, since OpenCV and skimage parallelize internally too
+        cpu_count = os.cpu_count() or 4
+        max_workers = max(1, min(cpu_count // 2, 8))
+        # OpenCV's thread pool is process-wide; share the cores between workers
+        # rather than letting every worker fan out across all of them
+        cv2.setNumThreads(max(1, cpu_count // max_workers))
         _cpu_executor = ThreadPoolExecutor(
             max_workers=max_workers,
-            thread_name_prefix="image_processing"
+            thread_name_prefix="image_processing",
+            initializer=_pin_worker_thread,
+            initargs=(itertools.count(), max_workers),
         )
         logging.info(f"Created CPU thread pool with {max_workers} workers")
     return _cpu_executor
 
 
+def _pin_worker_thread(worker_ids: "itertools.count[int]", worker_count: int):
+    """
+    Pin a CPU pool worker thread to its own slice of the allowed cores.
+
+    Keeps each worker's working set in one cache domain instead of migrating
+    between cores. Slices are taken from the process's current affinity mask
+    so container CPU limits are respected, and hold several cores when there
+    are more cores than workers so OpenCV's internal threads still have room.
+    Only Linux supports per-thread affinity through os; elsewhere this is a
+    no-op.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return
+    allowed = sorted(os.sched_getaffinity(0))
+    if len(allowed) < worker_count:
+        return
+    worker_id = next(worker_ids)
+    per_worker = len(allowed) // worker_count
+    cores = set(allowed[worker_id * per_worker:(worker_id + 1) * per_worker])
+    try:
+        os.sched_setaffinity(0, cores)
+    except OSError as e:
+        logging.warning(f"Could not pin {threading.current_thread().name} to cores {cores}: {e}")
+        return
+    logging.debug(f"Pinned {threading.current_thread().name} to cores {sorted(cores)}")
+
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get or create the global I/O thread pool executor."""
+    global _io_executor
+    if _io_executor is None:
+        max_workers = os.cpu_count() or 4
+        _io_executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="image_io"
+        )
+        logging.info(f"Created I/O thread pool with {max_workers} workers")
+    return _io_executor
+
+
+def _warm_worker(barrier: threading.Barrier, build_processor: bool):
+    """Hold a pool thread at the barrier so every worker gets started."""
+    if build_processor and getattr(_graxpert_pool, "proc", None) is None:
+        _graxpert_pool.proc = GraxpertStretch()
+    barrier.wait(timeout=10)
+
+
+def warmup_image_executors():
+    """
+    Start every CPU and I/O pool thread ahead of the first image request.
+
+    ThreadPoolExecutor only spawns a thread when no idle one is free, so each
+    pool is given one task per worker that waits on a shared barrier, which
+    forces all of them to exist. CPU workers also build their per-thread
+    GraxpertStretch.
+    """
+    for executor, build_processor in ((get_cpu_executor(), True), (get_io_executor(), False)):
+        workers = executor._max_workers
+        barrier = threading.Barrier(workers)
+        futures = [
+            executor.submit(_warm_worker, barrier, build_processor)
+            for _ in range(workers)
+        ]
+        for future in futures:
+            future.result()
+    logging.info("Image processing thread pools warmed up")
+
+
 def shutdown_cpu_executor():
-    """Shutdown the global CPU thread pool executor."""
-    global _cpu_executor
+    """Shutdown the global CPU and I/O thread pool executors."""
+    global _cpu_executor, _io_executor
     if _cpu_executor is not None:
         _cpu_executor.shutdown(wait=True)
         _cpu_executor = None
         logging.info("CPU thread pool executor shutdown")
+    if _io_executor is not None:
+        _io_executor.shutdown(wait=True)
+        _io_executor = None
+        logging.info("I/O thread pool executor shutdown")
 
 
 def _sync_graxpert_process(
@@ -57,48 +153,47 @@ def _sync_graxpert_process(
     Returns:
         Processed image array
     """
-    import threading
     logging.info(f"Starting sync GraXpert processing in thread: {threading.current_thread().name}")
     
-    # Create GraxpertStretch processor
-    graxpert_processor = GraxpertStretch()
+    # Reuse this worker's GraxpertStretch rather than building one per frame
+    graxpert_processor = getattr(_graxpert_pool, "proc", None)
+    if graxpert_processor is None:
+        graxpert_processor = _graxpert_pool.proc = GraxpertStretch()
     
-    if stretch_parameter is not None:
-        graxpert_processor.set_stretch_parameter(stretch_parameter)
+    graxpert_processor.set_stretch_parameter(
+        stretch_parameter or GraxpertStretch.DEFAULT_STRETCH_PARAMETER
+    )
     
-    # Configure enhancement parameters if provided
-    if enhancement_settings:
-        if 'upscaling' in enhancement_settings:
-            up = enhancement_settings['upscaling']
-            graxpert_processor.set_upscaling_params(
-                enabled=up.get('enabled', False),
-                scale_factor=up.get('scale_factor', 2.0),
-                method=UpscalingMethod(up.get('method', 'bicubic'))
-            )
-        
-        if 'sharpening' in enhancement_settings:
-            sharp = enhancement_settings['sharpening']
-            graxpert_processor.set_sharpening_params(
-                enabled=sharp.get('enabled', False),
-                method=SharpeningMethod(sharp.get('method', 'unsharp_mask')),
-                strength=sharp.get('strength', 1.0)
-            )
-        
-        if 'denoising' in enhancement_settings:
-            denoise = enhancement_settings['denoising']
-            graxpert_processor.set_denoise_params(
-                enabled=denoise.get('enabled', False),
-                method=DenoiseMethod(denoise.get('method', 'tv_chambolle')),
-                strength=denoise.get('strength', 1.0)
-            )
-        
-        if 'deconvolution' in enhancement_settings:
-            deconv = enhancement_settings['deconvolution']
-            graxpert_processor.set_deconvolve_params(
-                enabled=deconv.get('enabled', False),
-                strength=deconv.get('strength', 0.5),
-                psf_size=deconv.get('psf_size', 2.0)
-            )
+    # Apply every setting, falling back to defaults for sections that are not
+    # given, so nothing carries over from the previous call on this thread
+    settings = enhancement_settings or {}
+    up = settings.get('upscaling', {})
+    graxpert_processor.set_upscaling_params(
+        enabled=up.get('enabled', False),
+        scale_factor=up.get('scale_factor', 2.0),
+        method=UpscalingMethod(up.get('method', 'bicubic'))
+    )
+    
+    sharp = settings.get('sharpening', {})
+    graxpert_processor.set_sharpening_params(
+        enabled=sharp.get('enabled', False),
+        method=SharpeningMethod(sharp.get('method', 'unsharp_mask')),
+        strength=sharp.get('strength', 1.0)
+    )
+    
+    denoise = settings.get('denoising', {})
+    graxpert_processor.set_denoise_params(
+        enabled=denoise.get('enabled', False),
+        method=DenoiseMethod(denoise.get('method', 'tv_chambolle')),
+        strength=denoise.get('strength', 1.0)
+    )
+    
+    deconv = settings.get('deconvolution', {})
+    graxpert_processor.set_deconvolve_params(
+        enabled=deconv.get('enabled', False),
+        strength=deconv.get('strength', 0.5),
+        psf_size=deconv.get('psf_size', 2.0)
+    )
     
     # Process the image
     result = graxpert_processor.process(image_data, stretch_parameter)
@@ -107,6 +202,33 @@ def _sync_graxpert_process(
     return result
 
 
+def _graxpert_cache_key(
+    image_data: np.ndarray,
+    stretch_parameter: Optional[StretchParameter],
+    enhancement_settings: Optional[Dict[str, Any]]
+) -> bytes:
+    """Hash an image's pixels, shape and dtype together with its processing settings."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{image_data.shape}{image_data.dtype}{stretch_parameter!r}".encode())
+    digest.update(json.dumps(enhancement_settings, sort_keys=True, default=str).encode())
+    digest.update(np.ascontiguousarray(image_data))
+    return digest.digest()
+
+
+def _cache_graxpert_result(key: bytes, result: np.ndarray):
+    """Store a processed image, evicting the least recently used ones over budget."""
+    global _graxpert_cache_bytes
+    if key in _graxpert_cache or result.nbytes > GRAXPERT_CACHE_MAX_BYTES:
+        return
+    # Shared between callers from now on, so guard against in-place edits
+    result.flags.writeable = False
+    _graxpert_cache[key] = result
+    _graxpert_cache_bytes += result.nbytes
+    while _graxpert_cache_bytes > GRAXPERT_CACHE_MAX_BYTES:
+        _, evicted = _graxpert_cache.popitem(last=False)
+        _graxpert_cache_bytes -= evicted.nbytes
+
+
 def _sync_enhancement_process(
     image_data: np.ndarray,
     enhancement_settings: Dict[str, Any]
@@ -183,6 +305,17 @@ async def process_graxpert_async(
         Processed image array
     """
     loop = asyncio.get_event_loop()
+    
+    key = await loop.run_in_executor(
+        get_io_executor(),
+        functools.partial(_graxpert_cache_key, image_data, stretch_parameter, enhancement_settings)
+    )
+    cached = _graxpert_cache.get(key)
+    if cached is not None:
+        logging.info("Using cached GraXpert result for identical image and settings")
+        _graxpert_cache.move_to_end(key)
+        return cached
+    
     executor = get_cpu_executor()
     
     logging.info("Submitting GraXpert processing to thread pool")
@@ -199,6 +332,7 @@ async def process_graxpert_async(
     )
     
     logging.info("GraXpert processing completed in thread pool")
+    _cache_graxpert_result(key, result)
     return result
 
 
@@ -246,7 +380,7 @@ async def read_fits_async(fits_path: str) -> tuple[np.ndarray, Dict[str, Any]]:
         Tuple of (image_data, metadata)
     """
     loop = asyncio.get_event_loop()
-    executor = get_cpu_executor()
+    executor = get_io_executor()
     
     logging.info(f"Submitting FITS reading to thread pool: {fits_path}")
     
@@ -263,46 +397,47 @@ async def read_fits_async(fits_path: str) -> tuple[np.ndarray, Dict[str, Any]]:
 async def convert_to_pil_async(
     image_array: np.ndarray,
     output_format: str = "PNG"
-) -> bytes:
+) -> memoryview:
     """
-    Async wrapper for PIL image conversion that runs in a thread pool.
+    Async wrapper for image encoding (via OpenCV) that runs in a thread pool.
     
     Args:
         image_array: Image array to convert
         output_format: Output format (PNG, JPEG, etc.)
         
     Returns:
-        Image bytes
+        Encoded image as a bytes-like memoryview over OpenCV's output buffer
     """
     def _sync_convert():
-        from PIL import Image
-        import io
-        
         logging.info(f"Converting image to {output_format} in thread")
         
-        # Ensure proper data type
+        # Ensure proper data type; addWeighted with a uint8 result rounds and
+        # saturates in one pass (enhanced images can undershoot below 0)
         if image_array.dtype != np.uint8:
-            image_8bit = (np.clip(image_array, 0, 255)).astype(np.uint8)
+            image_8bit = cv2.addWeighted(
+                image_array, 1.0, image_array, 0.0, 0.0, dtype=cv2.CV_8U
+            )
         else:
             image_8bit = image_array
         
-        # Determine image mode
+        # OpenCV expects BGR channel order for color images
         if len(image_8bit.shape) == 3 and image_8bit.shape[2] == 3:
-            pil_image = Image.fromarray(image_8bit, mode='RGB')
-        else:
-            pil_image = Image.fromarray(image_8bit, mode='L')
+            image_8bit = cv2.cvtColor(image_8bit, cv2.COLOR_RGB2BGR)
         
-        # Convert to bytes
-        output_buffer = io.BytesIO()
-        pil_image.save(output_buffer, format=output_format)
-        return output_buffer.getvalue()
+        params = [cv2.IMWRITE_JPEG_QUALITY, 90] if output_format.upper() in ("JPEG", "JPG") else []
+        ok, buffer = cv2.imencode("." + output_format.lower(), image_8bit, params)
+        if not ok:
+            raise ValueError(f"Failed to encode image as {output_format}")
+        # Hand back a view of the encoder's buffer instead of copying it into
+        # a bytes object; callers only write it out
+        return buffer.reshape(-1).data
     
     loop = asyncio.get_event_loop()
-    executor = get_cpu_executor()
+    executor = get_io_executor()
     
-    logging.info(f"Submitting PIL conversion to thread pool")
+    logging.info(f"Submitting {output_format} encoding to thread pool")
     
     result = await loop.run_in_executor(executor, _sync_convert)
     
-    logging.info("PIL conversion completed in thread pool")
+    logging.info(f"{output_format} encoding completed in thread pool")
     return result
\ No newline at end of file
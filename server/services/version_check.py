@@ -1,6 +1,7 @@
 """Version checking service for GitHub releases."""
 
 import asyncio
+import functools
 import json
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
@@ -9,6 +10,12 @@ import httpx
 from loguru import logger
 
 
+@functools.lru_cache(maxsize=32)
+def _parse_version(value: str) -> version.Version:
+    """Parse a version string, memoized since the same few strings recur."""
+    return version.parse(value)
+
+
 class VersionChecker:
     """Service to check for new versions on GitHub."""
     
@@ -21,6 +28,11 @@ class VersionChecker:
         self.cache_duration = timedelta(hours=cache_duration_hours)
         self.last_check: Optional[datetime] = None
         self.cached_result: Optional[Dict[str, Any]] = None
+        # Last release payload and its ETag, for conditional requests
+        self._etag: Optional[str] = None
+        self._release_data: Optional[Dict[str, Any]] = None
+        # Kept open between checks so repeat checks reuse the connection
+        self._client: Optional[httpx.AsyncClient] = None
         
     async def check_for_updates(self, force_check: bool = False) -> Dict[str, Any]:
         """
@@ -95,33 +107,57 @@ class VersionChecker:
         """Fetch the latest release from GitHub API."""
         url = f"https://api.github.com/repos/{self.github_repo}/releases/latest"
         
-        # Add headers to reduce rate limiting
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "alp-experimental/1.0"
-        }
+        # A 304 for an unchanged release has no body and is not counted
+        # against the rate limit
+        headers = {}
+        if self._etag and self._release_data is not None:
+            headers["If-None-Match"] = self._etag
         
-        async with httpx.AsyncClient(timeout=10.0, headers=headers) as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    logger.warning(f"Repository {self.github_repo} not found or has no releases")
-                elif e.response.status_code == 429:
-                    logger.warning(f"GitHub API rate limit exceeded. Try again later.")
-                else:
-                    logger.error(f"HTTP error {e.response.status_code} when checking for updates")
-                return None
-            except Exception as e:
-                logger.error(f"Error fetching GitHub release: {e}")
-                return None
+        try:
+            response = await self._get_client().get(url, headers=headers)
+            if response.status_code == 304:
+                logger.debug("Latest release unchanged since last check")
+                return self._release_data
+            response.raise_for_status()
+            self._release_data = response.json()
+            self._etag = response.headers.get("ETag")
+            return self._release_data
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.warning(f"Repository {self.github_repo} not found or has no releases")
+            elif e.response.status_code == 429:
+                logger.warning(f"GitHub API rate limit exceeded. Try again later.")
+            else:
+                logger.error(f"HTTP error {e.response.status_code} when checking for updates")
+            return None
+        except Exception as e:
+            logger.error(f"Error fetching GitHub release: {e}")
+            return None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=10.0,
+                http2=True,
+                # Add headers to reduce rate limiting
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "User-Agent": "alp-experimental/1.0"
+                },
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     def _is_newer_version(self, latest: str, current: str) -> bool:
         """Compare version strings to determine if latest is newer."""
         try:
-            return version.parse(latest) > version.parse(current)
+            return _parse_version(latest) > _parse_version(current)
         except Exception as e:
             logger.warning(f"Error comparing versions '{latest}' vs '{current}': {e}")
             # Fallback to string comparison if version parsing fails
@@ -190,6 +226,12 @@ def get_version_checker() -> VersionChecker:
     return _version_checker
 
 
+async def close_version_checker():
+    """Close the global version checker's HTTP client, if one was created."""
+    if _version_checker is not None:
+        await _version_checker.close()
+
+
 async def check_for_updates(force: bool = False) -> Dict[str, Any]:
     """Convenience function to check for updates."""
     checker = get_version_checker()
@@ -5,14 +5,56 @@ from skimage.exposure import exposure
 from skimage.util import img_as_float32
 
 from smarttel.imaging.image_processor import ImageProcessor
-from smarttel.imaging.stretch import stretch, StretchParameters, StretchParameter
-from smarttel.imaging.upscaler import ImageEnhancementProcessor, UpscalingMethod, SharpeningMethod, DenoiseMethod
+from smarttel.imaging.stretch import stretch, StretchParameters, StretchParameter, MTF, clip_point_sample
+from smarttel.imaging.upscaler import ImageEnhancementProcessor, UpscalingMethod, SharpeningMethod, DenoiseMethod, _unit_float_to_uint8
+
+# Optional GPU pipeline (pip install .[gpu]); the CPU path is used without it
+try:
+    import cupy as cp
+    from cucim.skimage import exposure as gpu_exposure, transform as gpu_transform
+    from cucim.skimage.util import img_as_float32 as gpu_img_as_float32
+except ImportError:
+    cp = None
+
+
+# Elements per block when scanning an image's range; small enough that the
+# max() pass over a block is served from L2 after the min() pass loaded it
+_RANGE_SCAN_BLOCK = 1 << 16
+
+
+def _outside_unit_range(image: np.ndarray) -> bool:
+    """
+    Whether any value lies outside [0, 1].
+
+    Scans blocks of rows so min and max share one trip through memory rather
+    than two full-image passes, and stops at the first out-of-range block.
+    """
+    if image.size == 0:
+        return False
+    row_size = image.size // image.shape[0]
+    rows = max(1, _RANGE_SCAN_BLOCK // row_size)
+    for start in range(0, image.shape[0], rows):
+        block = image[start:start + rows]
+        if block.min() < 0 or block.max() > 1:
+            return True
+    return False
 
 
 class GraxpertStretch(ImageProcessor):
-    def __init__(self):
+    DEFAULT_STRETCH_PARAMETER: StretchParameter = "15% Bg, 3 sigma"
+
+    def __init__(self, use_gpu: bool = False, prefer_uint8: bool = True):
         self.enhancement_processor = ImageEnhancementProcessor()
-        self.stretch_parameter = "15% Bg, 3 sigma"
+        # Runs the post-stretch steps; upscaling is always off since it happens
+        # before the stretch. Shares the upscaler so it is only set up once.
+        self._post_processor = ImageEnhancementProcessor(upscaling_enabled=False, scale_factor=1.0)
+        self._post_processor.upscaler = self.enhancement_processor.upscaler
+        self.stretch_parameter = self.DEFAULT_STRETCH_PARAMETER
+        # Hand the enhancements 8-bit pixels rather than float32 0-255; turn off
+        # to compare against the float pipeline
+        self.prefer_uint8 = prefer_uint8
+        # The GPU pipeline is opt-in, and needs CuPy and cuCIM installed
+        self.use_gpu = use_gpu and cp is not None
 
     def process(
         self, image: np.ndarray, stretch_parameter: Optional[StretchParameter] = None
@@ -25,51 +67,107 @@ class GraxpertStretch(ImageProcessor):
         logging.trace(f"GraxpertStretch.process() starting with stretch_param: {stretch_param}")
         logging.trace(f"Input image shape: {image.shape}, dtype: {image.dtype}")
         
-        # Convert to float32 for processing
-        image_array = img_as_float32(image)
-        if np.min(image_array) < 0 or np.max(image_array > 1):
-            image_array = exposure.rescale_intensity(image_array, out_range=(0, 1))
+        image_display = None
+        if self.use_gpu:
+            try:
+                image_display = self._stretch_on_gpu(image, stretch_param)
+            except Exception as e:
+                logging.warning(f"GPU stretch failed, falling back to CPU: {e}")
+                self.use_gpu = False
 
-        # FIRST: Apply upscaling if enabled (before stretching for better quality)
-        if self.enhancement_processor.upscaling_enabled and self.enhancement_processor.scale_factor > 1.0:
-            logging.trace(f"Applying upscaling BEFORE stretching: method={self.enhancement_processor.upscaling_method}, scale_factor={self.enhancement_processor.scale_factor}")
-            image_array = self.enhancement_processor.upscaler.upscale(
-                image_array, 
-                scale_factor=self.enhancement_processor.scale_factor, 
-                method=self.enhancement_processor.upscaling_method
-            )
-            logging.trace(f"Upscaling complete, new shape: {image_array.shape}")
+        if image_display is None:
+            # Convert to float32 for processing (float32 input is used as is)
+            image_array = img_as_float32(image)
+            if _outside_unit_range(image_array):
+                image_array = exposure.rescale_intensity(image_array, out_range=(0, 1))
 
-        # SECOND: Apply stretch to the potentially upscaled image
-        logging.trace(f"Applying stretch with StretchParameters({stretch_param})")
-        image_display = stretch(image_array, StretchParameters(stretch_param))
-        image_display = image_display * 255
-        logging.trace(f"Stretch complete, image range: {np.min(image_display):.2f} - {np.max(image_display):.2f}")
+            # FIRST: Apply upscaling if enabled (before stretching for better quality)
+            if self.enhancement_processor.upscaling_enabled and self.enhancement_processor.scale_factor > 1.0:
+                logging.trace(f"Applying upscaling BEFORE stretching: method={self.enhancement_processor.upscaling_method}, scale_factor={self.enhancement_processor.scale_factor}")
+                image_array = self.enhancement_processor.upscaler.upscale(
+                    image_array,
+                    scale_factor=self.enhancement_processor.scale_factor,
+                    method=self.enhancement_processor.upscaling_method
+                )
+                logging.trace(f"Upscaling complete, new shape: {image_array.shape}")
+
+            # SECOND: Apply stretch to the potentially upscaled image
+            logging.trace(f"Applying stretch with StretchParameters({stretch_param})")
+            image_display = stretch(image_array, StretchParameters(stretch_param))
+            # Drop the unstretched (possibly upscaled) frame before the next copy
+            del image_array
+            logging.trace(f"Stretch complete, image shape: {image_display.shape}")
+
+        # Scale 0-1 to 0-255 in a single pass over the stretched image
+        if self.prefer_uint8:
+            # Multiply, saturate and cast together; "No Stretch" passes the
+            # upscaler's ringing through, so negatives must clamp to 0
+            image_display = _unit_float_to_uint8(image_display)
+        else:
+            # In place, unless "No Stretch" handed back the caller's own array
+            image_display = np.multiply(
+                image_display, 255, out=None if image_display is image else image_display
+            )
 
         # THIRD: Apply remaining enhancements (denoising, deconvolution, sharpening)
-        # Create a temporary processor without upscaling since we already did it
-        from smarttel.imaging.upscaler import ImageEnhancementProcessor
-        temp_processor = ImageEnhancementProcessor(
-            upscaling_enabled=False,  # Already done
-            scale_factor=1.0,
-            upscaling_method=self.enhancement_processor.upscaling_method,
-            sharpening_enabled=self.enhancement_processor.sharpening_enabled,
-            sharpening_method=self.enhancement_processor.sharpening_method,
-            sharpening_strength=self.enhancement_processor.sharpening_strength,
-            denoise_enabled=self.enhancement_processor.denoise_enabled,
-            denoise_method=self.enhancement_processor.denoise_method,
-            denoise_strength=self.enhancement_processor.denoise_strength,
-            deconvolve_enabled=self.enhancement_processor.deconvolve_enabled,
-            deconvolve_strength=self.enhancement_processor.deconvolve_strength,
-            deconvolve_psf_size=self.enhancement_processor.deconvolve_psf_size
-        )
+        # with the post-stretch processor, synced to the current settings
+        settings = self.enhancement_processor
+        post = self._post_processor
+        post.sharpening_enabled = settings.sharpening_enabled
+        post.sharpening_method = settings.sharpening_method
+        post.sharpening_strength = settings.sharpening_strength
+        post.denoise_enabled = settings.denoise_enabled
+        post.denoise_method = settings.denoise_method
+        post.denoise_strength = settings.denoise_strength
+        post.deconvolve_enabled = settings.deconvolve_enabled
+        post.deconvolve_strength = settings.deconvolve_strength
+        post.deconvolve_psf_size = settings.deconvolve_psf_size
         
         logging.trace(f"Calling enhancement_processor.process() for remaining enhancements on image with shape: {image_display.shape}")
-        image_display = temp_processor.process(image_display)
+        image_display = post.process(image_display)
         logging.trace(f"Enhancement processing complete, final shape: {image_display.shape}")
 
         return image_display
 
+    def _stretch_on_gpu(self, image: np.ndarray, stretch_param) -> np.ndarray:
+        """
+        Rescale, upscale and stretch on the GPU, copying back only the result.
+
+        Mirrors the CPU steps above: bicubic upscaling is done with cuCIM and
+        the per-channel MTF stretch is computed with CuPy, using the same
+        sampling and median/MAD clip points as smarttel.imaging.stretch.
+        A 2-D frame is stretched as a single channel.
+        """
+        image_array = gpu_img_as_float32(cp.asarray(image))
+        if float(image_array.min()) < 0 or float(image_array.max()) > 1:
+            image_array = gpu_exposure.rescale_intensity(image_array, out_range=(0, 1))
+
+        if self.enhancement_processor.upscaling_enabled and self.enhancement_processor.scale_factor > 1.0:
+            image_array = gpu_transform.rescale(
+                image_array,
+                self.enhancement_processor.scale_factor,
+                order=3,
+                channel_axis=-1 if image_array.ndim == 3 else None,
+                preserve_range=True,
+            ).astype(cp.float32, copy=False)
+
+        stretch_params = StretchParameters(stretch_param)
+        if stretch_params.do_stretch:
+            # A view, so stretching its channels writes into image_array
+            channels = image_array[..., None] if image_array.ndim == 2 else image_array
+            for c in range(channels.shape[-1]):
+                channel = channels[..., c]
+                sample = clip_point_sample(channel)
+                sample = sample[(sample > 0) & (sample < 1)]
+                median = cp.median(sample)
+                mad = cp.median(cp.abs(sample - median))
+                shadow = cp.clip(median - stretch_params.sigma * mad, 0, 1)
+                midtone = MTF((median - shadow) / (1 - shadow), stretch_params.bg)
+                channel = cp.clip((channel - shadow) / (1 - shadow), 0, 1)
+                channels[..., c] = (midtone - 1) * channel / ((2 * midtone - 1) * channel - midtone)
+
+        return cp.asnumpy(image_array)
+
     def set_stretch_parameter(self, stretch_parameter: StretchParameter):
         """Set the GraXpert stretch parameter."""
         self.stretch_parameter = stretch_parameter
@@ -89,28 +89,17 @@ def stretch(data, stretch_params: StretchParameters):
 
 
 def stretch_all(datas, mtf_stretch_params: list[MTFStretchParameters]):
-    shms = []
-    copies = []
     result = []
 
+    # Channels are stretched one after another in this process, so each image
+    # is copied once and stretched in place; staging it in shared memory first
+    # (as GraXpert does for its worker processes) only added a second copy
     for data, mtf_stretch_param in zip(datas, mtf_stretch_params):
-        shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
-        copy = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
-        np.copyto(copy, data)
-        shms.append(shm)
-        copies.append(copy)
-
+        copy = np.array(data, copy=True)
         for c in range(copy.shape[-1]):
-            stretch_channel(shm.name, c, mtf_stretch_param[c], copy.shape, copy.dtype)
-
-    for copy in copies:
-        copy = np.copy(copy)
+            _stretch_channel_inplace(copy[:, :, c], mtf_stretch_param[c])
         result.append(copy)
 
-    for shm in shms:
-        shm.close()
-        shm.unlink()
-
     return result
 
 
@@ -128,12 +117,21 @@ def calculate_mtf_stretch_parameters_for_image(stretch_params, image):
         ]
 
 
+def clip_point_sample(channel):
+    """Pixels the clip points are estimated from: every 4th column of a channel."""
+    # A strided view; a channel sliced out of an HWC image is not contiguous,
+    # so ravel() would copy all of it first
+    return channel[:, ::4]
+
+
 def calculate_mtf_stretch_parameters_for_channel(stretch_params, channel):
-    channel = channel.flatten()[::4]
+    channel = clip_point_sample(channel)
 
-    indx_clip = np.logical_and(channel < 1.0, channel > 0.0)
-    median = np.median(channel[indx_clip])
-    mad = np.median(np.abs(channel[indx_clip] - median))
+    # Both medians partition (O(n)) a private copy of the in-range samples
+    samples = channel[np.logical_and(channel < 1.0, channel > 0.0)]
+    median = np.median(samples, overwrite_input=True)
+    deviations = np.abs(np.subtract(samples, median, out=samples), out=samples)
+    mad = np.median(deviations, overwrite_input=True)
 
     shadow_clipping = np.clip(median - stretch_params.sigma * mad, 0, 1.0)
     highlight_clipping = 1.0
@@ -149,8 +147,16 @@ def stretch_channel(shm_name, c, mtf_stretch_params, shape, dtype):
     # logging.info("stretch.stretch_channel started")
     existing_shm = shared_memory.SharedMemory(name=shm_name)
     channels = np.ndarray(shape, dtype, buffer=existing_shm.buf)  # [:,:,channel_idx]
-    channel = channels[:, :, c]
 
+    try:
+        _stretch_channel_inplace(channels[:, :, c], mtf_stretch_params)
+    finally:
+        existing_shm.close()
+
+    # logging.info("stretch.stretch_channel finished")
+
+
+def _stretch_channel_inplace(channel, mtf_stretch_params):
     try:
         channel[channel <= mtf_stretch_params.shadow_clipping] = 0.0
         channel[channel >= mtf_stretch_params.highlight_clipping] = 1.0
@@ -164,13 +170,9 @@ def stretch_channel(shm_name, c, mtf_stretch_params, shape, dtype):
             channel[indx_inside] - mtf_stretch_params.shadow_clipping
         ) / (mtf_stretch_params.highlight_clipping - mtf_stretch_params.shadow_clipping)
 
-        channel = MTF(channel, mtf_stretch_params.midtone)
+        MTF(channel, mtf_stretch_params.midtone)
     except:
         logging.exception("An error occured while stretching a color channel")
-    finally:
-        existing_shm.close()
-
-    # logging.info("stretch.stretch_channel finished")
 
 
 def MTF(data, midtone):
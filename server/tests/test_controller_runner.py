@@ -170,52 +170,44 @@ class TestControllerRunner:
         assert not_found is None
 
     @pytest.mark.asyncio
-    async def test_startup_event_handler(self, controller):
-        """Test the startup event handler logic."""
-        # Add telescopes to connect
-        controller.telescopes["scope1"] = MagicMock()
-        controller.telescopes["scope2"] = MagicMock()
-
-        with patch("websocket_router.websocket_manager") as mock_ws_manager:
-            mock_ws_manager.start = AsyncMock()
-            with patch.object(
-                controller, "connect_all_telescopes", new=AsyncMock()
-            ) as mock_connect_all:
-                with patch("asyncio.sleep", new=AsyncMock()) as mock_sleep:
-                    with patch("asyncio.create_task") as mock_create_task:
-                        # Simulate the startup event handler
-                        await mock_ws_manager.start()
-
-                        # Simulate delayed connection task
-                        async def delayed_connect():
-                            await asyncio.sleep(2)
-                            await controller.connect_all_telescopes()
-
-                        # Execute the delayed connect task
-                        await delayed_connect()
-
-                        # Verify WebSocket manager started
-                        mock_ws_manager.start.assert_called_once()
-
-                        # Verify telescopes connected
-                        mock_connect_all.assert_called_once()
-                        mock_sleep.assert_called_once_with(2)
-
-    @pytest.mark.asyncio
-    async def test_shutdown_event_handler(self, controller):
-        """Test the shutdown event handler logic."""
-        with patch("websocket_router.websocket_manager") as mock_ws_manager:
-            mock_ws_manager.stop = AsyncMock()
+    async def test_lifespan_connects_and_disconnects_telescopes(self, controller):
+        """Test the lifespan starts services, connects and disconnects telescopes."""
+        telescope = MagicMock()
+        telescope.client.is_connected = True
+        telescope.client.disconnect = AsyncMock()
+        telescope.imaging.is_connected = False
+        telescope.imaging.disconnect = AsyncMock()
+        controller.telescopes["scope1"] = telescope
+
+        mock_ws_manager = MagicMock()
+        mock_ws_manager.start = AsyncMock()
+        mock_ws_manager.stop = AsyncMock()
+
+        with patch(
+            "websocket_manager.get_websocket_manager", return_value=mock_ws_manager
+        ):
             with patch(
                 "webrtc_router.cleanup_webrtc_service", new=AsyncMock()
             ) as mock_cleanup:
-                # Simulate the shutdown event handler
-                await mock_ws_manager.stop()
-                await mock_cleanup()
-
-                # Verify cleanup was called
-                mock_ws_manager.stop.assert_called_once()
-                mock_cleanup.assert_called_once()
+                with patch(
+                    "services.async_image_processing.shutdown_cpu_executor"
+                ) as mock_shutdown, patch(
+                    "services.async_image_processing.warmup_image_executors"
+                ) as mock_warmup:
+                    with patch.object(
+                        controller, "connect_all_telescopes", new=AsyncMock()
+                    ) as mock_connect_all:
+                        async with controller.lifespan(controller.app):
+                            await asyncio.sleep(0)
+                            mock_ws_manager.start.assert_called_once()
+                            mock_warmup.assert_called_once()
+                            mock_connect_all.assert_called_once()
+
+        telescope.client.disconnect.assert_called_once()
+        telescope.imaging.disconnect.assert_not_called()
+        mock_ws_manager.stop.assert_called_once()
+        mock_cleanup.assert_called_once()
+        mock_shutdown.assert_called_once()
 
 
 @pytest.mark.skipif(not CONTROLLER_AVAILABLE, reason="Controller not available")
@@ -3,8 +3,10 @@ Tests for remote WebSocket client functionality.
 """
 
 import pytest
+from collections.abc import Mapping
 from unittest.mock import AsyncMock, MagicMock, patch
 import asyncio
+import time
 import json
 
 from remote_websocket_client import (
@@ -34,6 +36,14 @@ class TestRemoteController:
         assert controller.reconnect_delay == 1.0
         assert controller.health_check_interval == 60.0
 
+    def test_remote_controller_without_telescope_id(self):
+        """Test that a missing telescope id is kept rather than raising."""
+        controller = RemoteController(
+            host="test.host", port=8000, telescope_id=None, controller_id="test"
+        )
+
+        assert controller.telescope_id is None
+
     def test_remote_controller_defaults(self):
         """Test RemoteController with default values."""
         controller = RemoteController(
@@ -61,6 +71,18 @@ class TestRemoteController:
         assert controller.reconnect_delay == 2.0
         assert controller.heartbeat_interval == 15.0
 
+    def test_remote_controller_is_frozen(self):
+        """Test RemoteController is immutable and hashable."""
+        from dataclasses import FrozenInstanceError
+
+        controller = RemoteController(
+            host="test.host", port=8000, telescope_id="test", controller_id="test"
+        )
+
+        with pytest.raises(FrozenInstanceError):
+            controller.port = 9000
+        assert {controller: 1}[controller] == 1
+
 
 class TestRemoteWebSocketClient:
     """Test RemoteWebSocketClient functionality."""
@@ -107,12 +129,19 @@ class TestRemoteWebSocketClient:
         # Mock a connected state
         from remote_websocket_client import RemoteConnectionState
 
+        from websockets.protocol import State
+
         client.connection_state = RemoteConnectionState.CONNECTED
         client.websocket = MagicMock()
+        client.websocket.state = State.OPEN
 
-        # Should be connected now (without checking websocket state)
+        # Should be connected now
         assert client.is_connected is True
 
+        # A socket that is closing no longer counts as connected
+        client.websocket.state = State.CLOSING
+        assert client.is_connected is False
+
     @pytest.mark.asyncio
     async def test_send_subscription(self, client):
         """Test sending subscription messages."""
@@ -133,6 +162,25 @@ class TestRemoteWebSocketClient:
         # Verify send_message was called
         client.send_message.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_restore_subscriptions_sends_single_bulk_frame(self, client):
+        """Test that several restored subscriptions go out in one frame."""
+        client.send_message = AsyncMock()
+        client.active_subscriptions = {
+            "telescope_a": ["all"],
+            "telescope_b": ["status"],
+        }
+
+        await client._restore_subscriptions()
+
+        client.send_message.assert_called_once()
+        message = client.send_message.call_args[0][0]
+        assert message["type"] == "subscribe_bulk"
+        assert message["payload"]["subscriptions"] == [
+            {"telescope_id": "telescope_a", "subscription_types": ["all"]},
+            {"telescope_id": "telescope_b", "subscription_types": ["status"]},
+        ]
+
     def test_force_reconnect(self, client):
         """Test manual force reconnection."""
         # Should not raise an exception
@@ -161,7 +209,7 @@ class TestRemoteWebSocketClient:
 
         assert status["is_connected"] is False
         assert status["reconnect_attempts"] == 0
-        assert isinstance(status["active_subscriptions"], dict)
+        assert isinstance(status["active_subscriptions"], Mapping)
 
     @pytest.mark.asyncio
     @patch("websockets.connect")
@@ -172,8 +220,7 @@ class TestRemoteWebSocketClient:
         mock_connect.return_value = mock_websocket
 
         # Mock other async methods
-        client._start_heartbeat = AsyncMock()
-        client._start_health_check = AsyncMock()
+        client._schedule_check = MagicMock()
         client._restore_subscriptions = AsyncMock()
 
         result = await client.connect()
@@ -197,23 +244,241 @@ class TestRemoteWebSocketClient:
         assert result is False
         client._schedule_reconnect.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_connect_waits_for_attempt(self, client):
+        """Test that a connect during a connection attempt shares its result."""
+        handshake = asyncio.Event()
+
+        async def open_websocket():
+            await handshake.wait()
+            raise ConnectionRefusedError("Connection refused")
+
+        client._open_websocket = open_websocket
+        client._schedule_reconnect = AsyncMock()
+
+        first = asyncio.create_task(client.connect())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(client.connect())
+        await asyncio.sleep(0)
+        assert not second.done()
+
+        handshake.set()
+        assert await asyncio.gather(first, second) == [False, False]
+        client._schedule_reconnect.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_disconnect(self, client):
         """Test disconnection."""
         # Setup connected state
-        client.websocket = AsyncMock()
-        client.reconnect_task = AsyncMock()
-        client.heartbeat_task = AsyncMock()
-        client.health_check_task = AsyncMock()
+        websocket = client.websocket = AsyncMock()
+        reconnect_task = client.reconnect_task = MagicMock()
+        check_handle = client._check_handle = MagicMock()
 
         await client.disconnect()
 
         # Verify cleanup
-        client.reconnect_task.cancel.assert_called_once()
-        client.heartbeat_task.cancel.assert_called_once()
-        client.health_check_task.cancel.assert_called_once()
-        client.websocket.close.assert_called_once()
+        reconnect_task.cancel.assert_called_once()
+        check_handle.cancel.assert_called_once()
+        websocket.close.assert_called_once()
         assert client.websocket is None
+        assert client._check_handle is None
+
+    @pytest.mark.asyncio
+    async def test_send_message_bounds_pending_responses(self, client):
+        """Test that the oldest awaited response is failed once the cap is hit."""
+        client._loop = asyncio.get_running_loop()
+        client.websocket = AsyncMock()
+
+        def command(message_id):
+            return {
+                "id": message_id,
+                "type": "control_command",
+                "payload": {"response_expected": True},
+            }
+
+        with patch("remote_websocket_client.MAX_PENDING_MESSAGES", 1), patch(
+            "remote_websocket_client.RemoteWebSocketClient.is_connected", True
+        ):
+            first = asyncio.create_task(client.send_message(command("cmd-1")))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(client.send_message(command("cmd-2")))
+            await asyncio.sleep(0)
+
+            with pytest.raises(asyncio.TimeoutError):
+                await first
+            assert list(client.pending_messages) == ["cmd-2"]
+
+            response = {"type": "command_response", "payload": {"command_id": "cmd-2"}}
+            await client._handle_remote_message(response)
+            assert await second == response
+            assert client.pending_messages == {}
+
+    @pytest.mark.asyncio
+    async def test_message_listener_decodes_binary_and_text_frames(
+        self, client, mock_message_handler
+    ):
+        """Test that MessagePack binary frames and JSON text frames both decode."""
+        pytest.importorskip("msgpack")
+        from websocket_protocol import pack_message
+
+        client._loop = asyncio.get_running_loop()
+        client._handle_disconnection = AsyncMock()
+        status = {"type": "status_update", "payload": {"battery": 90}}
+
+        async def frames():
+            yield pack_message(status)
+            yield json.dumps(status)
+
+        client.websocket = frames()
+        await client._message_listener()
+
+        assert mock_message_handler.await_count == 2
+        for call in mock_message_handler.await_args_list:
+            assert call.args == ("test_telescope", status)
+
+    @pytest.mark.asyncio
+    async def test_dispatch_credits_message_telescope(
+        self, client, mock_message_handler
+    ):
+        """Test that messages for sibling telescopes on one remote keep their id."""
+        sibling = {"type": "status_update", "telescope_id": "other_telescope"}
+        untagged = {"type": "status_update"}
+
+        await client._dispatch(sibling)
+        await client._dispatch(untagged)
+
+        assert [call.args for call in mock_message_handler.await_args_list] == [
+            ("other_telescope", sibling),
+            ("test_telescope", untagged),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_inbound_queue_drops_oldest_when_full(
+        self, client, mock_message_handler
+    ):
+        """Test that a slow message handler drops stale messages instead of blocking."""
+        client._inbox = asyncio.Queue(2)
+        for battery in range(3):
+            await client._handle_remote_message(
+                {"type": "status_update", "payload": {"battery": battery}}
+            )
+
+        mock_message_handler.assert_not_called()
+        assert client.dropped_messages == 1
+
+        client._dispatch_task = asyncio.create_task(
+            client._dispatch_loop(client._inbox)
+        )
+        await asyncio.sleep(0)
+        client._stop_dispatcher()
+
+        delivered = [
+            call.args[1]["payload"]["battery"]
+            for call in mock_message_handler.await_args_list
+        ]
+        assert delivered == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_writer_coalesces_queued_messages(self, client):
+        """Test that messages queued together go out as one batch frame."""
+        client._loop = asyncio.get_running_loop()
+        client.websocket = AsyncMock()
+        client._peer_batches = True
+        client._outbox = asyncio.Queue()
+        client._writer_task = asyncio.create_task(client._writer_loop(client._outbox))
+
+        messages = [{"type": "subscribe", "telescope_id": f"t{i}"} for i in range(3)]
+        await asyncio.gather(*(client._write(message) for message in messages))
+        client._stop_writer()
+
+        client.websocket.send.assert_called_once()
+        frame = json.loads(client.websocket.send.call_args[0][0])
+        assert frame["type"] == "batch"
+        assert frame["payload"]["items"] == messages
+
+    @pytest.mark.asyncio
+    async def test_concurrent_disconnections_reconnect_once(self, client):
+        """Test that overlapping disconnection reports schedule one reconnect."""
+        from remote_websocket_client import RemoteConnectionState
+
+        async def close():
+            await asyncio.sleep(0)
+
+        async def schedule_reconnect():
+            client.connection_state = RemoteConnectionState.RECONNECTING
+
+        client.connection_state = RemoteConnectionState.CONNECTED
+        client.websocket = MagicMock(close=close)
+        client._schedule_reconnect = AsyncMock(side_effect=schedule_reconnect)
+
+        await asyncio.gather(
+            client._handle_disconnection(), client._handle_disconnection()
+        )
+
+        client._schedule_reconnect.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_take_standby_skips_closed_connections(self, client):
+        """Test that only an open standby connection is adopted."""
+        from websockets.protocol import State
+
+        async def hold():
+            await asyncio.sleep(3600)
+
+        closed, ready = MagicMock(), MagicMock()
+        closed.state, ready.state = State.CLOSED, State.OPEN
+        client._standby = {
+            closed: asyncio.create_task(hold()),
+            ready: asyncio.create_task(hold()),
+        }
+
+        assert await client._take_standby() is ready
+        assert client._standby == {}
+
+    @pytest.mark.asyncio
+    async def test_health_check_rearms_until_messages_go_stale(self, client):
+        """Test that the health check re-arms itself and disconnects on timeout."""
+        from remote_websocket_client import RemoteConnectionState
+
+        loop = asyncio.get_running_loop()
+        client._loop = loop
+        client.connection_state = RemoteConnectionState.CONNECTED
+        client.websocket = MagicMock()
+        client._handle_disconnection = AsyncMock()
+        client.last_heartbeat = client.last_message_time = time.monotonic()
+
+        with patch(
+            "remote_websocket_client.RemoteWebSocketClient.is_connected", True
+        ):
+            client._on_check()
+            assert client._check_handle is not None
+            client._cancel_check()
+
+            client.last_message_time -= client.controller.message_timeout + 1
+            client._on_check()
+            assert client._check_handle is None
+            await asyncio.sleep(0)
+
+        client._handle_disconnection.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_is_queued_and_rearmed(self, client):
+        """Test that the client sends its own heartbeats to the controller."""
+        client._loop = asyncio.get_running_loop()
+        client._outbox = asyncio.Queue()
+
+        with patch(
+            "remote_websocket_client.RemoteWebSocketClient.is_connected", True
+        ):
+            client._on_heartbeat()
+
+        message, sent = client._outbox.get_nowait()
+        assert message["type"] == "heartbeat"
+        assert not sent.done()
+        assert client._heartbeat_handle is not None
+
+        client._cancel_check()
+        assert client._heartbeat_handle is None
 
 
 class TestRemoteWebSocketManager:
@@ -261,16 +526,92 @@ class TestRemoteWebSocketManager:
                 mock_connect.assert_called_once()
                 mock_subscribe.assert_called_once_with(["all"])
 
+    @pytest.mark.asyncio
+    async def test_add_remote_controllers_connects_concurrently(self, manager):
+        """Test that several controllers are connected concurrently."""
+        controllers = [
+            RemoteController(
+                host="localhost",
+                port=8000 + i,
+                telescope_id=f"telescope_{i}",
+                controller_id=f"controller_{i}",
+            )
+            for i in range(3)
+        ]
+        in_flight = 0
+        peak = 0
+
+        async def connect(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self.controller.port != 8001
+
+        with patch.object(RemoteWebSocketClient, "connect", connect):
+            with patch.object(
+                RemoteWebSocketClient, "send_subscription", new=AsyncMock()
+            ):
+                results = await manager.add_remote_controllers(controllers)
+
+        assert results == [True, False, True]
+        assert peak == 3
+        assert len(manager.clients) == 3
+
+    @pytest.mark.asyncio
+    async def test_add_remote_controllers_shared_controller_id(self, manager):
+        """Test that telescopes on one remote share its connection outcome."""
+        controllers = [
+            RemoteController(
+                host="localhost",
+                port=8000,
+                telescope_id=f"telescope_{i}",
+                controller_id="localhost:8000",
+            )
+            for i in range(3)
+        ]
+
+        async def connect(self):
+            await asyncio.sleep(0.01)
+            return True
+
+        with patch.object(RemoteWebSocketClient, "connect", connect):
+            with patch.object(
+                RemoteWebSocketClient, "send_subscription", new=AsyncMock()
+            ) as mock_subscribe:
+                results = await manager.add_remote_controllers(controllers)
+
+        assert results == [True, True, True]
+        assert len(manager.clients) == 1
+        client = manager.clients["localhost:8000"]
+        assert all(
+            manager._by_telescope[f"telescope_{i}"] is client for i in range(3)
+        )
+        assert mock_subscribe.await_count == 3
+        subscribed = {
+            call.kwargs.get("telescope_id", client.controller.telescope_id)
+            for call in mock_subscribe.await_args_list
+        }
+        assert subscribed == {f"telescope_{i}" for i in range(3)}
+
+        client.disconnect = AsyncMock()
+        await manager.remove_remote_controller("localhost:8000")
+        assert manager._by_telescope == {}
+
     @pytest.mark.asyncio
     async def test_remove_remote_controller(self, manager, controller):
         """Test removing a remote controller."""
         # First add a controller
         client_mock = AsyncMock()
+        client_mock.controller = controller
         manager.clients[controller.controller_id] = client_mock
+        manager._by_telescope[controller.telescope_id] = client_mock
 
         await manager.remove_remote_controller(controller.controller_id)
 
         assert controller.controller_id not in manager.clients
+        assert controller.telescope_id not in manager._by_telescope
         client_mock.disconnect.assert_called_once()
 
     @pytest.mark.asyncio
@@ -282,6 +623,7 @@ class TestRemoteWebSocketManager:
         client_mock.is_connected = True
         client_mock.send_message = AsyncMock(return_value={"status": "ok"})
         manager.clients[controller.controller_id] = client_mock
+        manager._by_telescope[controller.telescope_id] = client_mock
 
         message = {"type": "test", "data": "test_data"}
         result = await manager.send_to_telescope(controller.telescope_id, message)
@@ -308,6 +650,7 @@ class TestRemoteWebSocketManager:
         client_mock.controller = controller
         client_mock.connection_state.value = "connected"
         manager.clients[controller.controller_id] = client_mock
+        manager._by_telescope[controller.telescope_id] = client_mock
 
         status = manager.get_telescope_connection_status(controller.telescope_id)
         assert status == "connected"
@@ -319,6 +662,7 @@ class TestRemoteWebSocketManager:
         client_mock.controller = controller
         client_mock.force_reconnect = MagicMock()
         manager.clients[controller.controller_id] = client_mock
+        manager._by_telescope[controller.telescope_id] = client_mock
 
         result = manager.force_reconnect_telescope(
             controller.telescope_id, "Test reason"
@@ -356,6 +700,20 @@ class TestRemoteWebSocketManager:
         client2.disconnect.assert_called_once()
         assert manager.clients == {}
 
+    @pytest.mark.asyncio
+    async def test_disconnect_all_continues_past_failures(self, manager):
+        """Test that one failing disconnect doesn't stop the others."""
+        failing = AsyncMock()
+        failing.disconnect.side_effect = OSError("socket already closed")
+        healthy = AsyncMock()
+        manager.clients["controller1"] = failing
+        manager.clients["controller2"] = healthy
+
+        await manager.disconnect_all()
+
+        healthy.disconnect.assert_called_once()
+        assert manager.clients == {}
+
 
 class TestConnectionStateEnum:
     """Test RemoteConnectionState enum."""
@@ -426,6 +426,31 @@ class TestWebSocketSubscriptionHandling:
                 "telescope2", SubscriptionType.STATUS
             )
 
+    @pytest.mark.asyncio
+    async def test_handle_subscribe_bulk(self, manager, mock_connection):
+        """Test _handle_subscribe_bulk method."""
+        from websocket_protocol import MessageFactory, SubscribeBulkMessage
+
+        bulk_msg = MessageFactory.parse_message(
+            {
+                "id": "sub_bulk",
+                "type": "subscribe_bulk",
+                "timestamp": 1700000000.0,
+                "payload": {
+                    "subscriptions": [
+                        {"telescope_id": "telescope1", "subscription_types": ["status"]},
+                        {"telescope_id": "telescope2", "subscription_types": ["all"]},
+                    ]
+                },
+            }
+        )
+        assert isinstance(bulk_msg, SubscribeBulkMessage)
+
+        await manager._handle_subscribe_bulk(mock_connection, bulk_msg)
+
+        assert mock_connection.is_subscribed_to("telescope1", SubscriptionType.STATUS)
+        assert mock_connection.is_subscribed_to("telescope2", SubscriptionType.IMAGING)
+
     @pytest.mark.asyncio
     async def test_handle_unsubscribe(self, manager, mock_connection):
         """Test _handle_unsubscribe method."""
@@ -22,12 +22,16 @@ from smarttel.seestar.commands.settings import SetSetting, SettingParameters, Se
 from websocket_protocol import (
     WebSocketMessage,
     MessageFactory,
+    MessageType,
     SubscriptionType,
     StatusUpdateMessage,
     ControlCommandMessage,
     HeartbeatMessage,
     SubscribeMessage,
+    SubscribeBulkMessage,
     UnsubscribeMessage,
+    pack_message,
+    unpack_message,
     AnnotationEventMessage,
     ClientModeChangedMessage,
 )
@@ -39,6 +43,8 @@ class WebSocketConnection:
     def __init__(self, websocket: WebSocket, connection_id: str):
         self.websocket = websocket
         self.connection_id = connection_id
+        # Set when the client negotiated the MessagePack subprotocol
+        self.use_msgpack = False
         self.subscriptions: Dict[
             str, Set[SubscriptionType]
         ] = {}  # telescope_id -> subscription_types
@@ -67,7 +73,12 @@ class WebSocketConnection:
                     f"Could not check WebSocket state for {self.connection_id}: {state_check_error}"
                 )
 
-            await self.websocket.send_text(message.model_dump_json())
+            if self.use_msgpack:
+                await self.websocket.send_bytes(
+                    pack_message(message.model_dump(mode="json"))
+                )
+            else:
+                await self.websocket.send_text(message.model_dump_json())
             return True
         except Exception as e:
             logger.error(f"Failed to send message to {self.connection_id}: {e}")
@@ -208,7 +219,7 @@ class WebSocketManager:
         del self.connections[connection_id]
         logger.info(f"WebSocket connection closed: {connection_id}")
 
-    async def handle_message(self, connection_id: str, message_data: str):
+    async def handle_message(self, connection_id: str, message_data: str | bytes):
         """Handle incoming message from a WebSocket client."""
         if connection_id not in self.connections:
             logger.warning(f"Received message from unknown connection: {connection_id}")
@@ -218,27 +229,26 @@ class WebSocketManager:
         logger.debug(f"Handling message from {connection_id}: {message_data[:100]}...")
 
         try:
-            # Parse JSON message
-            data = json.loads(message_data)
-            message = MessageFactory.parse_message(data)
-            logger.debug(f"Parsed message type: {message.type} from {connection_id}")
+            # Parse JSON text frames and MessagePack binary frames
+            if isinstance(message_data, bytes):
+                data = unpack_message(message_data)
+            else:
+                data = json.loads(message_data)
 
             # Update heartbeat
             connection.last_heartbeat = asyncio.get_event_loop().time()
 
-            # Route message based on type
-            if isinstance(message, ControlCommandMessage):
-                await self._handle_control_command(connection, message)
-            elif isinstance(message, SubscribeMessage):
-                await self._handle_subscribe(connection, message)
-            elif isinstance(message, UnsubscribeMessage):
-                await self._handle_unsubscribe(connection, message)
-            elif isinstance(message, HeartbeatMessage):
-                # Don't echo heartbeat back - each side sends its own heartbeats
-                logger.debug(f"Received heartbeat from {connection_id}")
-                # Just update the last heartbeat time (already done above)
+            if data.get("type") == MessageType.BATCH:
+                # Several messages coalesced into one frame; route each in order
+                for item in data.get("payload", {}).get("items", []):
+                    try:
+                        await self._route_message(connection, item)
+                    except Exception as e:
+                        logger.error(
+                            f"Error handling batched message from {connection_id}: {e}"
+                        )
             else:
-                logger.warning(f"Unhandled message type: {message.type}")
+                await self._route_message(connection, data)
 
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON from {connection_id}: {e}")
@@ -249,6 +259,30 @@ class WebSocketManager:
             # Skip sending error messages to avoid WebSocket issues
             logger.debug(f"Skipping error message send to {connection_id}")
 
+    async def _route_message(
+            self, connection: WebSocketConnection, data: Dict[str, Any]
+    ):
+        """Parse a single message and route it to its handler."""
+        connection_id = connection.connection_id
+        message = MessageFactory.parse_message(data)
+        logger.debug(f"Parsed message type: {message.type} from {connection_id}")
+
+        # Route message based on type
+        if isinstance(message, ControlCommandMessage):
+            await self._handle_control_command(connection, message)
+        elif isinstance(message, SubscribeMessage):
+            await self._handle_subscribe(connection, message)
+        elif isinstance(message, SubscribeBulkMessage):
+            await self._handle_subscribe_bulk(connection, message)
+        elif isinstance(message, UnsubscribeMessage):
+            await self._handle_unsubscribe(connection, message)
+        elif isinstance(message, HeartbeatMessage):
+            # Don't echo heartbeat back - each side sends its own heartbeats
+            logger.debug(f"Received heartbeat from {connection_id}")
+            # Just update the last heartbeat time (already done by handle_message)
+        else:
+            logger.warning(f"Unhandled message type: {message.type}")
+
     async def broadcast_status_update(
             self,
             telescope_id: str,
@@ -386,6 +420,19 @@ class WebSocketManager:
             del self.telescope_clients[telescope_id]
             logger.info(f"Unregistered telescope client: {telescope_id}")
 
+    async def register_remote_controllers(
+        self, controllers: List[RemoteController]
+    ) -> List[bool]:
+        """Register and connect to several remote controllers concurrently."""
+        results = await self.remote_manager.add_remote_controllers(controllers)
+        for controller, success in zip(controllers, results):
+            if success:
+                self.remote_clients[controller.telescope_id] = controller.controller_id
+                logger.info(
+                    f"Registered remote controller {controller.controller_id} for telescope {controller.telescope_id}"
+                )
+        return results
+
     async def register_remote_controller(self, controller: RemoteController) -> bool:
         """Register and connect to a remote controller."""
         try:
@@ -1111,6 +1158,20 @@ class WebSocketManager:
                 )
             )
 
+    async def _handle_subscribe_bulk(
+            self, connection: WebSocketConnection, message: SubscribeBulkMessage
+    ):
+        """Handle a batch of per-telescope subscriptions sent in one frame."""
+        for entry in message.payload.get("subscriptions", []):
+            telescope_id = entry.get("telescope_id")
+            if not telescope_id:
+                continue
+            subscription_types = [
+                SubscriptionType(t)
+                for t in entry.get("subscription_types", [SubscriptionType.ALL])
+            ]
+            connection.add_subscription(telescope_id, subscription_types)
+
     async def _handle_unsubscribe(
             self, connection: WebSocketConnection, message: UnsubscribeMessage
     ):
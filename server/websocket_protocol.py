@@ -13,6 +13,27 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# WebSocket subprotocol under which binary frames carry MessagePack documents.
+# Text frames are always JSON, so either side may still send JSON.
+MSGPACK_SUBPROTOCOL = "msgpack.v1"
+
+_packer = msgpack.Packer() if msgpack is not None else None
+
+
+def pack_message(data: Dict[str, Any]) -> bytes:
+    """Encode a message as MessagePack for a binary frame."""
+    return _packer.pack(data)
+
+
+def unpack_message(frame: bytes) -> Dict[str, Any]:
+    """Decode a MessagePack binary frame."""
+    return msgpack.unpackb(frame, raw=False)
+
 
 class MessageType(str, Enum):
     """WebSocket message types."""
@@ -32,11 +53,17 @@ class MessageType(str, Enum):
 
     # Connection management
     HEARTBEAT = "heartbeat"
+    BATCH = "batch"
     ERROR = "error"
     SUBSCRIBE = "subscribe"
+    SUBSCRIBE_BULK = "subscribe_bulk"
     UNSUBSCRIBE = "unsubscribe"
 
 
+# Optional message types this server accepts, advertised in its heartbeats
+SERVER_FEATURES = [MessageType.BATCH.value, MessageType.SUBSCRIBE_BULK.value]
+
+
 class CommandAction(str, Enum):
     """Available telescope control actions."""
 
@@ -304,6 +331,22 @@ class SubscribeMessage(WebSocketMessage):
         )
 
 
+class SubscribeBulkMessage(WebSocketMessage):
+    """Several per-telescope subscriptions carried in a single frame."""
+
+    type: MessageType = MessageType.SUBSCRIBE_BULK
+
+    def __init__(
+        self,
+        subscriptions: Optional[List[Dict[str, Any]]] = None,
+        **data,
+    ):
+        super().__init__(
+            payload={"subscriptions": subscriptions or []},
+            **data,
+        )
+
+
 class UnsubscribeMessage(WebSocketMessage):
     """Client unsubscription from update types."""
 
@@ -331,7 +374,13 @@ class HeartbeatMessage(WebSocketMessage):
     type: MessageType = MessageType.HEARTBEAT
 
     def __init__(self, **data):
-        super().__init__(payload={"server_time": datetime.utcnow().isoformat()}, **data)
+        super().__init__(
+            payload={
+                "server_time": datetime.utcnow().isoformat(),
+                "features": SERVER_FEATURES,
+            },
+            **data,
+        )
 
 
 class ErrorMessage(WebSocketMessage):
@@ -364,6 +413,7 @@ WebSocketMessageUnion = Union[
     AlertMessage,
     ClientModeChangedMessage,
     SubscribeMessage,
+    SubscribeBulkMessage,
     UnsubscribeMessage,
     HeartbeatMessage,
     ErrorMessage,
@@ -405,6 +455,12 @@ class MessageFactory:
                 id=data.get("id"),
                 timestamp=data.get("timestamp"),
             )
+        elif message_type == MessageType.SUBSCRIBE_BULK:
+            return SubscribeBulkMessage(
+                subscriptions=payload.get("subscriptions", []),
+                id=data.get("id"),
+                timestamp=data.get("timestamp"),
+            )
         elif message_type == MessageType.UNSUBSCRIBE:
             # Extract unsubscription parameters from payload
             subscription_types = payload.get(
@@ -12,6 +12,7 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, Query
 from loguru import logger
 
 from websocket_manager import get_websocket_manager
+from websocket_protocol import MSGPACK_SUBPROTOCOL, msgpack
 
 # Export the global websocket_manager for compatibility with main.py imports
 def get_websocket_manager_global():
@@ -104,9 +105,16 @@ async def _handle_websocket_connection(
             f"WebSocket connection attempt (no telescope specified), client: {connection_id}"
         )
 
+    # Speak MessagePack when the client offers it and it is installed here
+    use_msgpack = (
+        msgpack is not None
+        and "subprotocols" in websocket.scope
+        and MSGPACK_SUBPROTOCOL in websocket.scope["subprotocols"]
+    )
+
     # Accept the WebSocket connection first
     try:
-        await websocket.accept()
+        await websocket.accept(subprotocol=MSGPACK_SUBPROTOCOL if use_msgpack else None)
         logger.info(f"WebSocket accepted: {connection_id}")
     except Exception as e:
         logger.error(f"Failed to accept WebSocket for {connection_id}: {e}")
@@ -115,6 +123,7 @@ async def _handle_websocket_connection(
     # Use manager to create connection but skip the accept step
     try:
         connection = await manager.connect(websocket, connection_id, skip_accept=True)
+        connection.use_msgpack = use_msgpack
     except Exception as e:
         logger.error(f"Failed to create connection for {connection_id}: {e}")
         return
@@ -129,8 +138,16 @@ async def _handle_websocket_connection(
         # Main message handling loop
         while True:
             try:
-                # Wait for incoming message
-                message = await websocket.receive_text()
+                # Wait for incoming message; binary frames carry MessagePack
+                if use_msgpack:
+                    frame = await websocket.receive()
+                    if frame["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(frame.get("code", 1000))
+                    message = frame.get("text")
+                    if message is None:
+                        message = frame["bytes"]
+                else:
+                    message = await websocket.receive_text()
                 logger.info(f"Received message on {connection_id}: {message[:200]}...")
 
                 # Check if connection is still alive before handling message